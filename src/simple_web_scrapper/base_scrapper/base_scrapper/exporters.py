@@ -0,0 +1,37 @@
+# Feed exporters that skip unset item fields.
+#
+# See documentation in:
+# https://docs.scrapy.org/en/latest/topics/exporters.html
+
+from scrapy import exporters
+
+
+class SkipUnsetFieldsMixin:
+    """Leave fields whose value is ``None`` out of the exported item.
+
+    Items are dataclasses whose fields all default to ``None`` and spiders
+    only assign what they extracted, so ``None`` marks an unset field. This
+    keeps the feed schema of ``scrapy.Item``, where such fields were absent
+    rather than ``null``. Exporters created with ``export_empty_fields=True``
+    (e.g. through a feed's ``item_export_kwargs``) export every field.
+    """
+
+    def get_serialized_fields(self, item, default_value=None, include_empty=None):
+        fields = super().get_serialized_fields(item, default_value, include_empty)
+        if include_empty is None:
+            include_empty = self.export_empty_fields
+        if include_empty:
+            return fields
+        return ((name, value) for name, value in fields if value is not None)
+
+
+class JsonItemExporter(SkipUnsetFieldsMixin, exporters.JsonItemExporter):
+    pass
+
+
+class JsonLinesItemExporter(SkipUnsetFieldsMixin, exporters.JsonLinesItemExporter):
+    pass
+
+
+class XmlItemExporter(SkipUnsetFieldsMixin, exporters.XmlItemExporter):
+    pass
@@ -2,49 +2,56 @@
 #
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
+#
+# Items are slotted dataclasses (supported natively by itemadapter), so the
+# spiders assign fields as plain attributes instead of going through the
+# dict-backed ``scrapy.Item`` validation on every ``__setitem__``.
 
-import scrapy
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 
-class BaseScrapperItem(scrapy.Item):
-    url = scrapy.Field()
-    title = scrapy.Field()
-    price = scrapy.Field()
-    currency = scrapy.Field()
-    location = scrapy.Field()
-    description = scrapy.Field()
-    year = scrapy.Field()
-    mileage = scrapy.Field()
-    warranty = scrapy.Field()
-    regional_specs = scrapy.Field()
-    transmission = scrapy.Field()
-    body_type = scrapy.Field()
-    color = scrapy.Field()
-    doors = scrapy.Field()
-    brand = scrapy.Field()
-    model = scrapy.Field()
-    seats = scrapy.Field()
-    wheel_drive = scrapy.Field()
-    accidents = scrapy.Field()
-    condition = scrapy.Field()
-    vin = scrapy.Field()
-    images = scrapy.Field()
+@dataclass(slots=True)
+class BaseScrapperItem:
+    url: Optional[str] = None
+    title: Optional[str] = None
+    price: Optional[int] = None
+    currency: Optional[str] = None
+    location: Any = None
+    description: Optional[str] = None
+    year: Any = None
+    mileage: Any = None
+    warranty: Any = None
+    regional_specs: Any = None
+    transmission: Any = None
+    body_type: Any = None
+    color: Any = None
+    doors: Optional[int] = None
+    brand: Any = None
+    model: Any = None
+    seats: Any = None
+    wheel_drive: Any = None
+    accidents: Any = None
+    condition: Any = None
+    vin: Any = None
+    images: Optional[List[str]] = None
 
 
-class PropertiesScrapperItem(scrapy.Item):
-    url = scrapy.Field()
-    title = scrapy.Field()
-    price = scrapy.Field()
-    currency = scrapy.Field()
-    description = scrapy.Field()
-    rent_or_buy = scrapy.Field()
-    bedrooms = scrapy.Field()
-    bathrooms = scrapy.Field()
-    images = scrapy.Field()
-    location = scrapy.Field()
-    city = scrapy.Field()
-    coordinates = scrapy.Field()
-    size = scrapy.Field()
-    property_type = scrapy.Field()
-    amenities = scrapy.Field()
-    year = scrapy.Field()
+@dataclass(slots=True)
+class PropertiesScrapperItem:
+    url: Optional[str] = None
+    title: Optional[str] = None
+    price: Optional[int] = None
+    currency: Optional[str] = None
+    description: Optional[str] = None
+    rent_or_buy: Any = None
+    bedrooms: Any = None
+    bathrooms: Any = None
+    images: Optional[List[str]] = None
+    location: Any = None
+    city: Any = None
+    coordinates: Optional[Dict[str, float]] = None
+    size: Any = None
+    property_type: Any = None
+    amenities: Optional[str] = None
+    year: Any = None
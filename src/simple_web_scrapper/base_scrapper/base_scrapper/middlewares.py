@@ -3,9 +3,19 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
+from importlib import import_module
+from queue import Queue
+from typing import List, Optional, Tuple
+
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
 from scrapy import signals
+from scrapy.http import HtmlResponse
+from scrapy.utils.defer import maybe_deferred_to_future
+from scrapy_selenium import SeleniumMiddleware, SeleniumRequest
+from selenium.webdriver.support.ui import WebDriverWait
+from twisted.internet import threads
+from twisted.internet.defer import Deferred, DeferredLock, DeferredSemaphore
 
 
 class BaseScrapperSpiderMiddleware:
@@ -97,3 +107,149 @@ class BaseScrapperDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class SeleniumPoolMiddleware(SeleniumMiddleware):
+    """SeleniumMiddleware that renders pooled requests on extra drivers.
+
+    Requests flagged with ``meta["selenium_pool"]`` are rendered in a worker
+    thread on a driver checked out from a pool of ``SELENIUM_POOL_SIZE``
+    drivers, so up to that many pages load concurrently. The pool is started
+    on the first pooled request, so crawls that never flag a request (or run
+    with the default size of 0) start no extra browsers. Every other
+    ``SeleniumRequest`` keeps using the shared ``self.driver`` on the reactor
+    thread, because listing callbacks drive it after the response arrives.
+    """
+
+    def __init__(
+        self,
+        driver_name,
+        driver_executable_path,
+        driver_arguments,
+        browser_executable_path,
+        pool_size: int = 0,
+    ):
+        # SeleniumMiddleware.__init__ only builds self.driver; that is done by
+        # _new_driver here so pooled drivers get exactly the same options.
+        self._driver_name = driver_name
+        self._driver_executable_path = driver_executable_path
+        self._driver_arguments = driver_arguments
+        self._browser_executable_path = browser_executable_path
+        self.driver = self._new_driver()
+        self.pool_size = pool_size
+        self._pool: Optional[Queue] = None
+        self._pool_drivers: List = []
+        # One worker thread per pooled driver at most, so pooled renders never
+        # block on Queue.get() while holding a reactor threadpool thread.
+        self._pool_slots: Optional[DeferredSemaphore] = None
+        # Serialises pool start-up between the first concurrent requests.
+        self._pool_lock = DeferredLock()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        middleware = super().from_crawler(crawler)
+        middleware.pool_size = crawler.settings.getint("SELENIUM_POOL_SIZE", 0)
+        return middleware
+
+    def start_pool(self, size: int) -> Deferred:
+        """Launch ``size`` pooled drivers in a worker thread, once.
+
+        The pool is only published when every driver has started; otherwise
+        the ones already running are quit and the next call tries again.
+        """
+        return self._pool_lock.run(self._start_pool, size)
+
+    def _start_pool(self, size: int) -> Optional[Deferred]:
+        if size <= 0 or self._pool is not None:
+            return None
+        return threads.deferToThread(self._launch_drivers, size).addCallback(
+            self._publish_pool
+        )
+
+    def _launch_drivers(self, size: int) -> List:
+        drivers = []
+        try:
+            for _ in range(size):
+                drivers.append(self._new_driver())
+        except Exception:
+            for driver in drivers:
+                driver.quit()
+            raise
+        return drivers
+
+    def _publish_pool(self, drivers: List) -> None:
+        pool: Queue = Queue()
+        for driver in drivers:
+            pool.put(driver)
+        self._pool_drivers = drivers
+        self._pool_slots = DeferredSemaphore(len(drivers))
+        self._pool = pool
+
+    def _new_driver(self):
+        # Same construction as SeleniumMiddleware.__init__.
+        webdriver_base_path = f"selenium.webdriver.{self._driver_name}"
+        driver_klass = import_module(f"{webdriver_base_path}.webdriver").WebDriver
+        driver_options = import_module(f"{webdriver_base_path}.options").Options()
+        if self._browser_executable_path:
+            driver_options.binary_location = self._browser_executable_path
+        for argument in self._driver_arguments:
+            driver_options.add_argument(argument)
+
+        return driver_klass(
+            **{
+                "executable_path": self._driver_executable_path,
+                f"{self._driver_name}_options": driver_options,
+            }
+        )
+
+    async def process_request(self, request, spider):
+        if (
+            self.pool_size <= 0
+            or not isinstance(request, SeleniumRequest)
+            or not request.meta.get("selenium_pool")
+        ):
+            return super().process_request(request, spider)
+
+        await maybe_deferred_to_future(self.start_pool(self.pool_size))
+        url, body, screenshot = await maybe_deferred_to_future(
+            self._pool_slots.run(threads.deferToThread, self._render_pooled, request)
+        )
+        # request.meta is only touched back on the reactor thread.
+        if screenshot is not None:
+            request.meta["screenshot"] = screenshot
+        return HtmlResponse(url, body=body, encoding="utf-8", request=request)
+
+    def _render_pooled(
+        self, request: SeleniumRequest
+    ) -> Tuple[str, bytes, Optional[bytes]]:
+        # _pool_slots guarantees a free driver, so this never waits.
+        driver = self._pool.get_nowait()
+        try:
+            driver.get(request.url)
+
+            for cookie_name, cookie_value in request.cookies.items():
+                driver.add_cookie({"name": cookie_name, "value": cookie_value})
+
+            if request.wait_until:
+                WebDriverWait(driver, request.wait_time).until(request.wait_until)
+
+            screenshot = None
+            if request.screenshot:
+                screenshot = driver.get_screenshot_as_png()
+
+            if request.script:
+                driver.execute_script(request.script)
+
+            body = str.encode(driver.page_source)
+            url = driver.current_url
+        finally:
+            # The driver goes straight back to the pool, so it is deliberately
+            # not exposed through request.meta["driver"].
+            self._pool.put(driver)
+
+        return url, body, screenshot
+
+    def spider_closed(self):
+        super().spider_closed()
+        for driver in self._pool_drivers:
+            driver.quit()
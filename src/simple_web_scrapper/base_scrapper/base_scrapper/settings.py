@@ -33,9 +33,15 @@ SELENIUM_BROWSER_EXECUTABLE_PATH = (
 )
 
 DOWNLOADER_MIDDLEWARES = {
-    "scrapy_selenium.SeleniumMiddleware": 800,
+    "base_scrapper.middlewares.SeleniumPoolMiddleware": 800,
 }
 
+# Extra drivers used to render pooled detail pages concurrently. 0 disables
+# the pool and every page goes through the single shared driver. Configurable
+# spiders flag their detail requests with meta["selenium_pool"]; opt in with
+# -s SELENIUM_POOL_SIZE=4 -s CONCURRENT_REQUESTS_PER_DOMAIN=5.
+SELENIUM_POOL_SIZE = 0
+
 
 # Crawl responsibly by identifying yourself (and your website) on the user-agent
 # USER_AGENT = "base_scrapper (+http://www.yourdomain.com)"
@@ -107,3 +113,13 @@ DOWNLOAD_DELAY = 1
 
 # Set settings whose default value is deprecated to a future-proof value
 FEED_EXPORT_ENCODING = "utf-8"
+
+# Leave unset (None) item fields out of JSON and XML feeds, as they were when
+# items were scrapy.Item subclasses (see base_scrapper.exporters).
+FEED_EXPORTERS = {
+    "json": "base_scrapper.exporters.JsonItemExporter",
+    "jsonlines": "base_scrapper.exporters.JsonLinesItemExporter",
+    "jsonl": "base_scrapper.exporters.JsonLinesItemExporter",
+    "jl": "base_scrapper.exporters.JsonLinesItemExporter",
+    "xml": "base_scrapper.exporters.XmlItemExporter",
+}
@@ -1,11 +1,84 @@
 import re
+from urllib.parse import urljoin
 
+import scrapy
+from lxml import etree
+from parsel.csstranslator import HTMLTranslator
+from scrapy.utils.response import get_base_url
 from scrapy_selenium import SeleniumRequest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from w3lib.html import remove_tags
 
-from ..items import *
+from ..items import BaseScrapperItem
+
+_DIGITS_RE = re.compile(r"(\d+)")
+_CARDS_CSS = (
+    "div.vehica-inventory-v1__2-cols > div > div.vehica-inventory-v1__row-grid > div"
+)
+# Expected conditions are stateless, so requests share these instead of
+# building a new one each time.
+_CARDS_PRESENT = EC.presence_of_all_elements_located((By.CSS_SELECTOR, _CARDS_CSS))
+_CARD_ROWS_PRESENT = EC.presence_of_all_elements_located(
+    (By.CSS_SELECTOR, "div.vehica-car-card-row-wrapper.vehica-car")
+)
+# swap to a stable selector on detail
+_DETAIL_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
+
+# Only the presence of an enabled "next" button matters, so parse tests the
+# compiled XPath on the raw lxml tree instead of serialising the match.
+_NEXT_BUTTON_XPATH = etree.XPath(
+    HTMLTranslator().css_to_xpath(
+        "button.vehica-pagination-mobile__arrow.vehica-pagination-mobile__arrow--right"
+        ":not([disabled]):not(.disabled):not([aria-disabled='true'])"
+    )
+)
+_DIGIT_RE = re.compile(r"\d")
+_CURRENCY_CODE_RE = re.compile(r"([A-Za-z]+)")
+_PRICE_RE = re.compile(r"([\d,]+)")
+
+# Script injected by next_button_pager: click "next", then wait for new cards.
+_NEXT_BUTTON_SCRIPT = """
+console.log('=== Starting pagination ===');
+
+// Store the first card's href BEFORE clicking
+const firstCardBefore = document.querySelector('a.vehica-car-card-link');
+const hrefBefore = firstCardBefore ? firstCardBefore.href : null;
+console.log('First card before:', hrefBefore);
+
+// Click the button
+const button = document.querySelector('button.vehica-pagination-mobile__arrow.vehica-pagination-mobile__arrow--right:not([disabled])');
+if (!button) {
+    console.log('ERROR: Button not found');
+    return;
+}
+
+button.click();
+console.log('Button clicked');
+
+// Wait for the first card to change (with timeout)
+return new Promise((resolve) => {
+    let attempts = 0;
+    const maxAttempts = 50; // 50 attempts * 100ms = 5 seconds max
+
+    const checkInterval = setInterval(() => {
+        attempts++;
+        const firstCardNow = document.querySelector('a.vehica-car-card-link');
+        const hrefNow = firstCardNow ? firstCardNow.href : null;
+
+        // Check if content changed
+        if (hrefNow && hrefNow !== hrefBefore) {
+            console.log('Content changed! New first card:', hrefNow);
+            clearInterval(checkInterval);
+            resolve(true);
+        } else if (attempts >= maxAttempts) {
+            console.log('Timeout waiting for content change');
+            clearInterval(checkInterval);
+            resolve(false);
+        }
+    }, 100); // Check every 100ms
+});
+"""
 
 
 class BaseSpider(scrapy.Spider):
@@ -18,12 +91,7 @@ class BaseSpider(scrapy.Spider):
             url=url,
             callback=self.parse,
             wait_time=10,
-            wait_until=EC.presence_of_all_elements_located(
-                (
-                    By.CSS_SELECTOR,
-                    "div.vehica-inventory-v1__2-cols > div > div.vehica-inventory-v1__row-grid > div",
-                )
-            ),
+            wait_until=_CARDS_PRESENT,
             # Example: you can run JS before giving control back to Scrapy:
             # script="window.scrollTo(0, document.body.scrollHeight);",
         )
@@ -37,9 +105,7 @@ class BaseSpider(scrapy.Spider):
         except ValueError:
             curr_page = 1
 
-        cards = response.css(
-            "div.vehica-inventory-v1__2-cols > div > div.vehica-inventory-v1__row-grid > div"
-        )
+        cards = response.css(_CARDS_CSS)
         self.logger.info("Found %s cards on page %s", len(cards), curr_page)
 
         first_card_href = None
@@ -48,19 +114,16 @@ class BaseSpider(scrapy.Spider):
                 card, first_card_href, response
             )
 
-        next_button = response.css(
-            "button.vehica-pagination-mobile__arrow.vehica-pagination-mobile__arrow--right"
-            ":not([disabled]):not(.disabled):not([aria-disabled='true'])"
-        ).get()
+        if _NEXT_BUTTON_XPATH(response.selector.root):
+            yield from self.next_button_pager(curr_page, first_card_href, response)
+            return
 
         # Check for anchor-based pagination
         next_anchor = response.css(
             "a.vehica-pagination-mobile__arrow.vehica-pagination-mobile__arrow--right::attr(href)"
         ).get()
 
-        if next_button:
-            yield from self.next_button_pager(curr_page, first_card_href, response)
-        elif next_anchor:
+        if next_anchor:
             yield from self.next_href_pager(curr_page, next_anchor, response)
         else:
             self.logger.info("No more pages found after page %s", curr_page)
@@ -84,9 +147,7 @@ class BaseSpider(scrapy.Spider):
                 callback=self.parse_detail,
                 cb_kwargs={"title": title},
                 wait_time=10,
-                wait_until=EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "body")  # swap to a stable selector on detail
-                ),
+                wait_until=_DETAIL_PRESENT,
             )
         return first_card_href
 
@@ -98,12 +159,7 @@ class BaseSpider(scrapy.Spider):
             url=response.urljoin(next_anchor),
             callback=self.parse,
             wait_time=10,
-            wait_until=EC.presence_of_all_elements_located(
-                (
-                    By.CSS_SELECTOR,
-                    "div.vehica-inventory-v1__2-cols > div > div.vehica-inventory-v1__row-grid > div",
-                )
-            ),
+            wait_until=_CARDS_PRESENT,
         )
 
     def next_button_pager(self, curr_page, first_card_href, response):
@@ -116,51 +172,9 @@ class BaseSpider(scrapy.Spider):
             callback=self.parse,
             dont_filter=True,
             meta={"current_page": curr_page},
-            script=f"""
-                    console.log('=== Starting pagination ===');
-
-                    // Store the first card's href BEFORE clicking
-                    const firstCardBefore = document.querySelector('a.vehica-car-card-link');
-                    const hrefBefore = firstCardBefore ? firstCardBefore.href : null;
-                    console.log('First card before:', hrefBefore);
-
-                    // Click the button
-                    const button = document.querySelector('button.vehica-pagination-mobile__arrow.vehica-pagination-mobile__arrow--right:not([disabled])');
-                    if (!button) {{
-                        console.log('ERROR: Button not found');
-                        return;
-                    }}
-
-                    button.click();
-                    console.log('Button clicked');
-
-                    // Wait for the first card to change (with timeout)
-                    return new Promise((resolve) => {{
-                        let attempts = 0;
-                        const maxAttempts = 50; // 50 attempts * 100ms = 5 seconds max
-
-                        const checkInterval = setInterval(() => {{
-                            attempts++;
-                            const firstCardNow = document.querySelector('a.vehica-car-card-link');
-                            const hrefNow = firstCardNow ? firstCardNow.href : null;
-
-                            // Check if content changed
-                            if (hrefNow && hrefNow !== hrefBefore) {{
-                                console.log('Content changed! New first card:', hrefNow);
-                                clearInterval(checkInterval);
-                                resolve(true);
-                            }} else if (attempts >= maxAttempts) {{
-                                console.log('Timeout waiting for content change');
-                                clearInterval(checkInterval);
-                                resolve(false);
-                            }}
-                        }}, 100); // Check every 100ms
-                    }});
-                """,
+            script=_NEXT_BUTTON_SCRIPT,
             wait_time=15,  # Overall timeout
-            wait_until=EC.presence_of_all_elements_located(
-                (By.CSS_SELECTOR, "div.vehica-car-card-row-wrapper.vehica-car")
-            ),
+            wait_until=_CARD_ROWS_PRESENT,
         )
 
     def save_response_test(self, response):
@@ -172,52 +186,52 @@ class BaseSpider(scrapy.Spider):
         self.save_response_test(response)
 
         item = BaseScrapperItem()
-        item["title"] = title
-        item["url"] = response.url
-        item["transmission"] = self.get_text(
+        item.title = title
+        item.url = response.url
+        item.transmission = self.get_text(
             response,
             "//div[@class='vehica-grid__element vehica-grid__element--1of1 vehica-grid__element--tablet-1of2 vehica-grid__element--mobile-1of1']//div[@class='vehica-car-attributes__values vehica-grid__element--1of2'][normalize-space()='Automatic' or normalize-space()='Manual']/text()",
             False,
         )
-        item["year"] = self.get_text(
+        item.year = self.get_text(
             response,
             '//div[contains(@class,"vehica-car-attributes__name") and contains(normalize-space(.),"Year:")]/following-sibling::div[contains(@class,"vehica-car-attributes__values")][1]/text()',
             False,
         )
-        item["mileage"] = self.get_text(
+        item.mileage = self.get_text(
             response,
             '//div[contains(@class,"vehica-car-attributes__name") and contains(normalize-space(.),"Mileage:")]/following-sibling::div[contains(@class,"vehica-car-attributes__values")][1]/text()',
             False,
         )
-        item["brand"] = self.get_text(
+        item.brand = self.get_text(
             response,
             '//div[contains(@class,"vehica-car-attributes__name") and contains(normalize-space(.),"Make:")]/following-sibling::div[contains(@class,"vehica-car-attributes__values")][1]/text()',
             False,
         )
-        item["model"] = self.get_text(
+        item.model = self.get_text(
             response,
             '//div[contains(@class,"vehica-car-attributes__name") and contains(normalize-space(.),"Model:")]/following-sibling::div[contains(@class,"vehica-car-attributes__values")][1]/text()',
             False,
         )
-        item["wheel_drive"] = self.get_text(
+        item.wheel_drive = self.get_text(
             response,
             '//div[contains(@class,"vehica-car-attributes__name") and contains(normalize-space(.),"Drive Type:")]/following-sibling::div[contains(@class,"vehica-car-attributes__values")][1]/text()',
             False,
         )
-        item["condition"] = self.get_text(
+        item.condition = self.get_text(
             response,
             '//div[contains(@class,"vehica-car-attributes__name") and contains(normalize-space(.),"Condition:")]/following-sibling::div[contains(@class,"vehica-car-attributes__values")][1]/text()',
             False,
         )
-        item["images"] = self.image_urls(response)
-        item["warranty"] = self.get_text(response, "")
-        item["regional_specs"] = self.get_text(response, "")
-        item["body_type"] = self.get_text(response, "")
-        item["color"] = self.get_text(response, "")
-        item["location"] = self.get_text(response, "")
-        item["seats"] = self.get_text(response, "")
-        item["accidents"] = self.get_text(response, "")
-        item["vin"] = self.get_text(response, "")
+        item.images = self.image_urls(response)
+        item.warranty = self.get_text(response, "")
+        item.regional_specs = self.get_text(response, "")
+        item.body_type = self.get_text(response, "")
+        item.color = self.get_text(response, "")
+        item.location = self.get_text(response, "")
+        item.seats = self.get_text(response, "")
+        item.accidents = self.get_text(response, "")
+        item.vin = self.get_text(response, "")
 
         self.assign_doors(item, response)
         self.assign_amount_currency(item, response)
@@ -229,11 +243,16 @@ class BaseSpider(scrapy.Spider):
             "//div[contains(@class,'vehica-swiper-slide')]//img/@src"
         ).getall()
         # filter out data:image/gif;base64 placeholder images
-        clean_urls = [
-            response.urljoin(u)
-            for u in raw_urls
-            if not re.match(r"^data:image/[^;]+;base64,", u)
-        ]
+        base_url = get_base_url(response)
+        clean_urls = []
+        append = clean_urls.append
+        for u in raw_urls:
+            if u.startswith("data:image/") and ";base64," in u:
+                continue
+            if u.startswith(("http://", "https://")):
+                append(u)
+            else:
+                append(urljoin(base_url, u))
         return clean_urls
 
     def assign_doors(self, item, response):
@@ -245,9 +264,9 @@ class BaseSpider(scrapy.Spider):
             is_css=False,
         )
         if doors_text:
-            m = re.search(r"(\d+)", doors_text)
+            m = _DIGITS_RE.search(doors_text)
             if m:
-                item["doors"] = int(m.group(1))
+                item.doors = int(m.group(1))
 
     def get_text(self, response, selector, is_css=True):
         if selector and len(selector) > 0:
@@ -263,23 +282,20 @@ class BaseSpider(scrapy.Spider):
     def assign_description(self, item, response):
         desc_html = response.css("div.vehica-car-description").get()
         if desc_html:
-            clean_desc = (
-                remove_tags(desc_html).replace("\n", " ").replace("\r", " ").strip()
-            )
-            item["description"] = re.sub(r"\s+", " ", clean_desc)
+            item.description = " ".join(remove_tags(desc_html).split())
 
     def assign_amount_currency(self, item, response):
         currency_text = response.css("div.vehica-car-price:nth-of-type(1)::text").get()
         if currency_text:
             currency_text = currency_text.strip()
-            if re.search(r"\d", currency_text):
-                cur_match = re.search(r"([A-Za-z]+)", currency_text)
-                item["currency"] = cur_match.group(1) if cur_match else None
+            if _DIGIT_RE.search(currency_text):
+                cur_match = _CURRENCY_CODE_RE.search(currency_text)
+                item.currency = cur_match.group(1) if cur_match else None
 
         # Extract price
         price_text = response.css("div.vehica-car-price:nth-of-type(1)::text").get()
         if price_text:
             price_text = price_text.strip()
-            num_match = re.search(r"([\d,]+)", price_text)
+            num_match = _PRICE_RE.search(price_text)
             if num_match:
-                item["price"] = int(num_match.group(1).replace(",", ""))
+                item.price = int(num_match.group(1).replace(",", ""))
@@ -1,25 +1,130 @@
+import inspect
 import json
+import os
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Optional, Set
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import scrapy
+from cssselect import SelectorError
+from lxml import etree
+from parsel.csstranslator import HTMLTranslator
 from scrapy.http import Response
-from scrapy.selector import Selector
+from scrapy.selector import Selector, SelectorList
 from scrapy_selenium import SeleniumRequest
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from w3lib.html import remove_tags
 
 from ..items import BaseScrapperItem
 from .field_utilities import FieldUtilities
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is a drop-in for loads()
+    orjson = None
+
+# Shared result for rules without a usable selector; avoids running a dummy
+# CSS query just to get an empty SelectorList.
+_EMPTY_SELECTION = SelectorList([])
+# Marks a rule missing from the compiled-selector table (a stored None means
+# the rule has no usable selector).
+_UNCOMPILED = object()
+# Distinguishes "key absent" from a stored None when popping listing fields.
+_MISSING = object()
+
+# Scroll once to trigger lazy-loaded cards and hand back the resulting DOM in
+# the same WebDriver round trip (instead of execute_script + page_source).
+_SCROLL_AND_READ_SCRIPT = (
+    "window.scrollBy(0, 1000); return document.documentElement.outerHTML;"
+)
+
+# Used when the listing config has a "scroll" block: keep scrolling by `delta`
+# px, pausing `idle` ms for lazy content, until `passes` is reached or the page
+# bottom is hit, then return the DOM through the async callback.
+_MULTI_SCROLL_SCRIPT = """
+const [passes, delta, idle, done] = arguments;
+let pass = 0;
+(function step() {
+    window.scrollBy(0, delta);
+    pass += 1;
+    setTimeout(() => {
+        const atBottom =
+            window.innerHeight + window.scrollY >= document.body.scrollHeight;
+        if (pass >= passes || atBottom) {
+            done(document.documentElement.outerHTML);
+        } else {
+            step();
+        }
+    }, idle);
+})();
+"""
+
+# Accepted values for a listing/detail section's "render" key.
+_RENDER_MODES = ("selenium", "http")
+
+# listing "scroll" keys -> (default, minimum), in _MULTI_SCROLL_SCRIPT order.
+_SCROLL_DEFAULTS = {"passes": (5, 1), "delta": (1000, 1), "idle_ms": (250, 0)}
+
+# Headroom on top of passes * idle_ms for the scroll script's own work; the
+# script timeout is raised to cover the whole run (Selenium defaults to 30s).
+_SCROLL_TIMEOUT_MARGIN_S = 10.0
+
+# Directory config paths are resolved against (besides the CWD).
+_SPIDERS_DIR = str(Path(__file__).resolve().parent)
+
+# Characters lxml's text output leaves raw but remove_tags(html) keeps escaped.
+_HTML_ESCAPED_CHARS = frozenset("&<>")
+
+_CSS_TRANSLATOR = HTMLTranslator()
+# Same EXSLT prefixes parsel registers for its own XPath evaluation.
+_XPATH_NAMESPACES = {
+    "re": "http://exslt.org/regular-expressions",
+    "set": "http://exslt.org/sets",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _ListingFieldPlan:
+    """How one listing field is read from a card, resolved at startup.
+
+    ``mode`` is ``"default"``, ``"one"`` or ``"all"``; ``position`` is where
+    the field's required utilities go in its pipeline.
+    """
+
+    key: str
+    rule: Any
+    xpath: Optional[etree.XPath]
+    mode: str
+    position: str
+
 
 class ConfigurableBaseSpider(scrapy.Spider):
     item_cls = BaseScrapperItem
     default_wait_time = 30
+    _RESERVED_DETAIL_KEYS: ClassVar[FrozenSet[str]] = frozenset(
+        {"images", "description", "price", "currency"}
+    )
     pagination_dont_filter = True
+    # Parsed config files keyed by resolved path, shared by every spider
+    # instance in the process; each entry remembers the file's mtime so an
+    # edited config is re-read.
+    _CONFIG_CACHE: ClassVar[Dict[str, Tuple[int, Dict[str, Any]]]] = {}
 
     def __init__(
         self, site: Optional[str] = None, config: Optional[str] = None, *args, **kwargs
@@ -31,8 +136,7 @@ class ConfigurableBaseSpider(scrapy.Spider):
             )
 
         cfg_path = self._resolve_config_path(config)
-        with open(cfg_path, "r", encoding="utf-8") as f:
-            sites = json.load(f)
+        sites = self._load_config(cfg_path)
         self.logger.info("Using config: %s", cfg_path)
 
         self.cfg = sites.get(site)
@@ -50,49 +154,96 @@ class ConfigurableBaseSpider(scrapy.Spider):
         self.start_url = self.start_urls[0]
         self.listing = self.cfg["listing"]
         self.detail = self.cfg["detail"]
+        for section_name in ("listing", "detail"):
+            render = self.cfg[section_name].get("render", "selenium")
+            if render not in _RENDER_MODES:
+                raise ValueError(
+                    f"Site '{site}' {section_name}.render must be one of "
+                    f"{', '.join(_RENDER_MODES)}; got {render!r}."
+                )
+        # Per spider: its pipeline caches hold this spider's rule dicts and
+        # must not outlive it (or pin rules from a reloaded config).
         self.utilities = FieldUtilities()
+        # Compiled selectors keyed by id() of the config's rule dicts. The
+        # dicts belong to the shared _CONFIG_CACHE entry, so nothing is
+        # written into them; self.cfg keeps them (and their ids) alive.
+        self._rule_xpaths: Dict[int, Optional[etree.XPath]] = {}
+        # Resolved once; populate_listing_fields consults it for every item.
+        self._reserved_detail_keys = frozenset(self.get_reserved_detail_keys())
+        self._compile_rules(self.listing)
+        self._compile_rules(self.detail)
+        self._listing_field_plan = self._build_listing_field_plan()
+        self._detail_ops = self._build_detail_ops()
+        # Expected conditions are stateless callables, so each section's wait
+        # is built once and shared by every request that renders it.
+        self._listing_scroll = self._resolve_scroll(self.listing.get("scroll"))
+        if self._listing_scroll is not None:
+            passes, _, idle_ms = self._listing_scroll
+            self._listing_scroll_timeout = (
+                passes * idle_ms / 1000 + _SCROLL_TIMEOUT_MARGIN_S
+            )
+        self._listing_wait = (
+            self._build_wait_condition(self.listing, expect_many=True)
+            if self._renders_with_selenium(self.listing)
+            else None
+        )
+        self._detail_wait = (
+            self._build_wait_condition(self.detail, expect_many=False)
+            if self._renders_with_selenium(self.detail)
+            else None
+        )
 
     # ------------------------------------------------------------------
     # Core request flow
     # ------------------------------------------------------------------
     def start_requests(self):
-        wait_until = self._build_wait_condition(self.listing, expect_many=True)
         for start_url in self.start_urls:
             self.logger.info("Starting crawl at %s", start_url)
+            if self._listing_wait is None:
+                yield scrapy.Request(start_url, callback=self.parse)
+                continue
             yield SeleniumRequest(
                 url=start_url,
                 callback=self.parse,
                 wait_time=self.default_wait_time,
-                wait_until=wait_until,
+                wait_until=self._listing_wait,
             )
 
     def parse(self, response, page_num: int = 1):
-        driver = response.request.meta["driver"]
-        self._ensure_driver_on_response_url(driver, response)
-        driver.execute_script("window.scrollBy(0, 1000);")
+        driver = response.request.meta.get("driver")
+        if driver is not None:
+            self._ensure_driver_on_response_url(driver, response)
+            if self._listing_scroll is None:
+                html = driver.execute_script(_SCROLL_AND_READ_SCRIPT)
+            else:
+                driver.set_script_timeout(self._listing_scroll_timeout)
+                html = driver.execute_async_script(
+                    _MULTI_SCROLL_SCRIPT, *self._listing_scroll
+                )
 
-        sel = Selector(text=driver.page_source)
+            # Swap in the scrolled DOM once; cards, listing fields and
+            # pagination then all share the single lxml tree cached on
+            # response.selector.
+            response = response.replace(body=html, encoding="utf-8")
 
-        cards = list(self.get_listing_cards(sel))  # sel works with your helpers
+        cards = self.get_listing_cards(response.selector)
         self.log_listing_summary(response, len(cards), page_num)
 
         for card in cards:
-            title = self.extract_card_title(card)
             href = self.extract_card_href(card)
+            if not href:
+                continue
+            title = self.extract_card_title(card)
             listing_fields = self.extract_card_listing_fields(response, card)
-            if href:
-                yield self.build_detail_request(response, href, title, listing_fields)
+            yield self.build_detail_request(response, href, title, listing_fields)
 
         yield from self.handle_pagination(response, page_num)
 
     # ------------------------------------------------------------------
     # Listing helpers
     # ------------------------------------------------------------------
-    def get_listing_cards(self, response: Response) -> Iterable[Selector]:
-        cards_selector = self.listing["cards"]
-        cards = self._sel_nodes(response, cards_selector)
-        self.logger.debug("Extracted %d listing cards", len(cards))
-        return cards
+    def get_listing_cards(self, response: Response) -> SelectorList:
+        return self._sel_nodes(response, self.listing["cards"])
 
     def log_listing_summary(
         self, response: Response, card_count: int, page_num: int
@@ -119,19 +270,65 @@ class ConfigurableBaseSpider(scrapy.Spider):
         href: str,
         title: str,
         listing_fields: Optional[Dict[str, Any]] = None,
-    ) -> SeleniumRequest:
-        wait_until = self._build_wait_condition(self.detail, expect_many=False)
-        request_kwargs: Dict = {
-            "url": response.urljoin(href),
-            "callback": self.parse_detail,
-            "wait_time": self.default_wait_time,
-            "wait_until": wait_until,
-        }
+    ) -> scrapy.Request:
         cb_kwargs: Dict[str, Any] = {"title": title}
         if listing_fields:
             cb_kwargs["listing_fields"] = listing_fields
-        request_kwargs["cb_kwargs"] = cb_kwargs
-        return SeleniumRequest(**request_kwargs)
+
+        url = self._absolute_url(response, href)
+        if not self._renders_with_selenium(self.detail):
+            return scrapy.Request(url, callback=self.parse_detail, cb_kwargs=cb_kwargs)
+
+        return SeleniumRequest(
+            url=url,
+            callback=self.parse_detail,
+            wait_time=self.default_wait_time,
+            wait_until=self._detail_wait,
+            # Detail callbacks never touch the driver, so they can render on
+            # any pooled driver concurrently.
+            meta={"selenium_pool": True},
+            cb_kwargs=cb_kwargs,
+        )
+
+    @staticmethod
+    def _absolute_url(response: Response, href: str) -> str:
+        # Most sites emit absolute links; only relative ones need urljoin.
+        if href.startswith(("http://", "https://")):
+            return href
+        return response.urljoin(href)
+
+    @staticmethod
+    def _resolve_scroll(scroll_cfg: Optional[Dict]) -> Optional[Tuple[int, int, int]]:
+        # Optional listing "scroll": {"passes": int, "delta": int, "idle_ms": int}
+        if not scroll_cfg:
+            return None
+        if not isinstance(scroll_cfg, dict):
+            raise ValueError("listing.scroll must be an object")
+        unknown = set(scroll_cfg) - set(_SCROLL_DEFAULTS)
+        if unknown:
+            raise ValueError(
+                f"Unknown listing.scroll keys: {', '.join(sorted(unknown))}"
+            )
+        values = []
+        for key, (default, minimum) in _SCROLL_DEFAULTS.items():
+            value = scroll_cfg.get(key, default)
+            # bool is an int subclass, but "passes": true is a config mistake.
+            if type(value) is not int or value < minimum:
+                raise ValueError(
+                    f"listing.scroll.{key} must be an integer >= {minimum}; "
+                    f"got {value!r}"
+                )
+            values.append(value)
+        return tuple(values)
+
+    @staticmethod
+    def _renders_with_selenium(section_cfg: Dict[str, Any]) -> bool:
+        # Sections set "render": "http" (or omit "wait_css") when the page is
+        # server-rendered, so a plain Scrapy download is enough and the
+        # browser is skipped.
+        return section_cfg.get("render", "selenium") != "http" and bool(
+            section_cfg.get("wait_css")
+        )
 
     def _resolve_start_urls(self):
         start_urls = self.cfg.get("start_urls")
@@ -186,7 +383,7 @@ class ConfigurableBaseSpider(scrapy.Spider):
     # ------------------------------------------------------------------
     def handle_pagination(
         self, response: Response, page_num: int
-    ) -> Iterable[SeleniumRequest]:
+    ) -> Iterable[scrapy.Request]:
         anc_rule = self.listing.get("next_anchor")
 
         if anc_rule:
@@ -196,7 +393,7 @@ class ConfigurableBaseSpider(scrapy.Spider):
 
     def build_next_anchor_request(
         self, response: Response, page_num: int, anc_rule: Dict
-    ) -> Optional[SeleniumRequest]:
+    ) -> Optional[scrapy.Request]:
         next_href = self._get_one(response, anc_rule)
         if not next_href or next_href.strip() in ("", "#"):
             self.logger.debug(
@@ -210,17 +407,17 @@ class ConfigurableBaseSpider(scrapy.Spider):
             "Navigating to page %d via anchor %s", next_page_num, next_href
         )
 
-        full_url = response.urljoin(next_href)  # handles absolute and relatives URLs
-        wait_until = self._build_wait_condition(self.listing, expect_many=True)
-        request_kwargs: Dict = {
-            "url": full_url,
-            "callback": self.parse,
-            "wait_time": self.default_wait_time,
-            "wait_until": wait_until,
-        }
-        if cb_kwargs:
-            request_kwargs["cb_kwargs"] = cb_kwargs
-        return SeleniumRequest(**request_kwargs)
+        full_url = self._absolute_url(response, next_href)
+        if self._listing_wait is None:
+            return scrapy.Request(full_url, callback=self.parse, cb_kwargs=cb_kwargs)
+
+        return SeleniumRequest(
+            url=full_url,
+            callback=self.parse,
+            wait_time=self.default_wait_time,
+            wait_until=self._listing_wait,
+            cb_kwargs=cb_kwargs,
+        )
 
     def _ensure_driver_on_response_url(
         self, driver: WebDriver, response: Response
@@ -235,7 +432,6 @@ class ConfigurableBaseSpider(scrapy.Spider):
         if self._urls_equivalent(current_url, response.url):
             return
 
-        wait_until = self._build_wait_condition(self.listing, expect_many=True)
         log_current = current_url or "<unavailable>"
         self.logger.debug(
             "Driver URL %s does not match response %s. Reloading page.",
@@ -245,7 +441,7 @@ class ConfigurableBaseSpider(scrapy.Spider):
 
         driver.get(response.url)
         try:
-            WebDriverWait(driver, self.default_wait_time).until(wait_until)
+            WebDriverWait(driver, self.default_wait_time).until(self._listing_wait)
         except TimeoutException:
             self.logger.warning(
                 "Timed out while waiting for %s to be ready after driver reload.",
@@ -271,80 +467,150 @@ class ConfigurableBaseSpider(scrapy.Spider):
         listing_fields: Optional[Dict[str, Any]] = None,
     ):
         item = self.item_cls()
-        item["title"] = title
-        item["url"] = response.url
+        item.title = title
+        item.url = response.url
 
         if listing_fields:
             self.populate_listing_fields(response, item, listing_fields)
 
-        fields = self.detail.get("fields", {})
         self.logger.debug("Parsing detail page for %s", response.url)
-
-        self.populate_generic_fields(response, item, fields)
-        self.populate_images(response, item, fields)
-        self.populate_description(response, item, fields)
-        self.populate_price(response, item, fields)
-        self.populate_currency(response, item, fields)
-        self.populate_additional_detail(response, item, fields)
+        for op in self._detail_ops:
+            op(response, item)
 
         yield item
 
-    def populate_generic_fields(
-        self, response: Response, item: scrapy.Item, fields: Dict
-    ) -> None:
-        reserved = self.get_reserved_detail_keys()
+    def _build_detail_ops(self) -> List[Callable[[Response, Any], None]]:
+        # One bound handler per configured field, in config order, so
+        # parse_detail makes a single pass over the fields. Reserved keys
+        # without a handler are left to populate_additional_detail, and empty
+        # rules are dropped here since that does not depend on the page.
+        fields = self.detail.get("fields", {})
+        handlers = self.get_detail_handlers()
+        reserved = self._reserved_detail_keys
+        legacy = {
+            key: handler
+            for key, handler in handlers.items()
+            if self._is_legacy_detail_hook(handler)
+        }
+        ops: List[Callable[[Response, Any], None]] = []
+        # A subclass still overriding the old per-page generic hook gets it
+        # called first, as before, and it owns every field without a handler.
+        legacy_generic = (
+            type(self).populate_generic_fields
+            is not ConfigurableBaseSpider.populate_generic_fields
+        )
+        if legacy_generic:
+            self.logger.warning(
+                "populate_generic_fields is deprecated; override "
+                "populate_generic_field(response, item, key, rule) instead"
+            )
+            ops.append(partial(self.populate_generic_fields, fields=fields))
         for key, rule in fields.items():
-            if key in reserved:
+            if not rule or key in legacy:
                 continue
-
-            if isinstance(rule, dict) and "default_value" in rule:
-                item[key] = rule["default_value"]
-                self.logger.debug(
-                    "Field %s assigned default value %s", key, rule["default_value"]
-                )
+            handler = handlers.get(key)
+            if handler is None:
+                if key in reserved or legacy_generic:
+                    continue
+                handler = self.populate_generic_field
+            ops.append(partial(handler, key=key, rule=rule))
+
+        # Overrides still written against the old (response, item, fields)
+        # shape run once per page and look their rules up themselves.
+        seen = set()
+        for key, handler in legacy.items():
+            func = getattr(handler, "__func__", handler)
+            if func in seen:
                 continue
+            seen.add(func)
+            self.logger.warning(
+                "%s uses the deprecated (response, item, fields) signature; "
+                "detail handlers now take (response, item, key, rule)",
+                handler.__name__,
+            )
+            ops.append(partial(handler, fields=fields))
+        ops.append(partial(self.populate_additional_detail, fields=fields))
+        return ops
 
-            if rule.get("get_all"):
-                val = self._get_all(response, rule)
-                val = " ".join(val).strip() if val else None
-            else:
-                val = self._get_one(response, rule)
+    @staticmethod
+    def _is_legacy_detail_hook(handler: Callable[..., None]) -> bool:
+        try:
+            params = inspect.signature(handler).parameters
+        except (TypeError, ValueError):
+            return False
+        return "fields" in params and "rule" not in params
+
+    def get_detail_handlers(self) -> Dict[str, Callable[..., None]]:
+        return {
+            "images": self.populate_images,
+            "description": self.populate_description,
+            "price": self.populate_price,
+            "currency": self.populate_currency,
+        }
 
-            cleaned = self.utilities.process_detail(
-                val, key=key, rule=rule, context={"response": response}
+    def populate_generic_field(
+        self, response: Response, item: Any, key: str, rule: Dict
+    ) -> None:
+        if "default_value" in rule:
+            setattr(item, key, rule["default_value"])
+            self.logger.debug(
+                "Field %s assigned default value %s", key, rule["default_value"]
             )
-            if cleaned is not None:
-                item[key] = cleaned
-                self.logger.debug("Field %s extracted as %s", key, item[key])
+            return
+
+        if rule.get("get_all"):
+            val = self._get_all(response, rule)
+            val = " ".join(val).strip() if val else None
+        else:
+            val = self._get_one(response, rule)
+
+        cleaned = self.utilities.process_detail(
+            val, key=key, rule=rule, context={"response": response}
+        )
+        if cleaned is not None:
+            setattr(item, key, cleaned)
+            self.logger.debug("Field %s extracted as %s", key, cleaned)
+
+    def populate_generic_fields(
+        self, response: Response, item: Any, fields: Dict
+    ) -> None:
+        """Deprecated per-page form of populate_generic_field.
+
+        Only called when a subclass overrides it; fills every non-reserved
+        field through populate_generic_field.
+        """
+        reserved = self._reserved_detail_keys
+        for key, rule in fields.items():
+            if rule and key not in reserved:
+                self.populate_generic_field(response, item, key, rule)
 
     def populate_images(
-        self, response: Response, item: scrapy.Item, fields: Dict
+        self, response: Response, item: Any, key: str, rule: Dict
     ) -> None:
-        images_rule = fields.get("images")
-        if not images_rule:
+        if not rule:
             return
 
-        raw_urls = self._get_all(response, images_rule)
+        raw_urls = self._get_all(response, rule)
         images = self.utilities.process_detail(
             raw_urls,
-            key="images",
-            rule=images_rule,
+            key=key,
+            rule=rule,
             position="prefix",
             context={"response": response},
         )
         if images:
-            item["images"] = images
+            item.images = images
             self.logger.debug("Collected %d images", len(images))
 
     def populate_description(
-        self, response: Response, item: scrapy.Item, fields: Dict
+        self, response: Response, item: Any, key: str, rule: Dict
     ) -> None:
-        rule = fields.get("description")
         if not rule:
             return
 
-        if isinstance(rule, dict) and rule.get("default_value") is not None:
-            item["description"] = rule["default_value"]
+        # Unlike the other fields, a null default means "extract it".
+        if rule.get("default_value") is not None:
+            item.description = rule["default_value"]
             self.logger.debug("Description assigned default value")
             return
 
@@ -355,245 +621,296 @@ class ConfigurableBaseSpider(scrapy.Spider):
 
         description = self.utilities.process_detail(
             raw_value,
-            key="description",
+            key=key,
             rule=rule,
             context={"response": response},
         )
         if description:
-            item["description"] = description
+            item.description = description
             self.logger.debug(
-                "Description populated with %d characters",
-                len(item.get("description", "")),
+                "Description populated with %d characters", len(description)
             )
 
     def populate_price(
-        self, response: Response, item: scrapy.Item, fields: Dict
+        self, response: Response, item: Any, key: str, rule: Dict
     ) -> None:
-        price_rule = fields.get("price")
-        if not price_rule:
+        if not rule:
             return
 
-        if isinstance(price_rule, dict) and "default_value" in price_rule:
-            item["price"] = price_rule["default_value"]
-            self.logger.debug(
-                "Price assigned default value %s", price_rule["default_value"]
-            )
+        if "default_value" in rule:
+            item.price = rule["default_value"]
+            self.logger.debug("Price assigned default value %s", rule["default_value"])
             return
 
-        if price_rule.get("get_all"):
-            price = self._get_all(response, price_rule)
+        if rule.get("get_all"):
+            price = self._get_all(response, rule)
             price = " ".join(price).strip() if price else None
         else:
-            price = self._get_one(response, price_rule)
+            price = self._get_one(response, rule)
 
         normalized = self.utilities.process_detail(
             price,
-            key="price",
-            rule=price_rule,
+            key=key,
+            rule=rule,
             context={"response": response},
         )
         if normalized is not None:
-            item["price"] = normalized
+            item.price = normalized
             self.logger.debug("Price normalised to %s", normalized)
 
     def populate_currency(
-        self, response: Response, item: scrapy.Item, fields: Dict
+        self, response: Response, item: Any, key: str, rule: Dict
     ) -> None:
-        currency_rule = fields.get("currency")
-        if not currency_rule:
+        if not rule:
             return
 
-        if isinstance(currency_rule, dict) and "default_value" in currency_rule:
-            item["currency"] = currency_rule["default_value"]
+        if "default_value" in rule:
+            item.currency = rule["default_value"]
             self.logger.debug(
-                "Currency assigned default value %s", currency_rule["default_value"]
+                "Currency assigned default value %s", rule["default_value"]
             )
             return
 
-        currency = self._get_one(response, currency_rule)
+        currency = self._get_one(response, rule)
         currency = self.utilities.process_detail(
             currency,
-            key="currency",
-            rule=currency_rule,
+            key=key,
+            rule=rule,
             context={"response": response},
         )
         if currency:
-            item["currency"] = currency
-            self.logger.debug("Currency extracted as %s", item.get("currency"))
+            item.currency = currency
+            self.logger.debug("Currency extracted as %s", currency)
 
     def populate_additional_detail(
-        self, response: Response, item: scrapy.Item, fields: Dict
+        self, response: Response, item: Any, fields: Dict
     ) -> None:
         """Hook for subclasses to enrich the item."""
 
     def populate_listing_fields(
         self,
         response: Response,
-        item: scrapy.Item,
+        item: Any,
         listing_fields: Dict[str, Any],
     ) -> None:
-        reserved = self.get_reserved_detail_keys()
+        reserved = self._reserved_detail_keys
+        process = self.utilities.process_listing
+        context = {"response": response}
 
         base_url = listing_fields.pop("_listing_base", response.url)
         listing_rules = self.listing.get("fields", {}) or {}
+        get_rule = listing_rules.get
 
-        if "images" in listing_fields:
-            images = self.utilities.process_listing(
-                listing_fields["images"],
+        # Reserved keys are popped so the generic loop below only sees the rest.
+        images = listing_fields.pop("images", _MISSING)
+        if images is not _MISSING:
+            images = process(
+                images,
                 key="images",
-                rule=listing_rules.get("images"),
+                rule=get_rule("images"),
                 position="prefix",
                 context={"base": base_url, "response": response},
             )
             if images:
-                item["images"] = images
+                item.images = images
                 self.logger.debug(
                     "Listing images pre-populated with %d entries", len(images)
                 )
 
-        if "description" in listing_fields:
-            description = self.utilities.process_listing(
-                listing_fields.get("description"),
+        description = listing_fields.pop("description", _MISSING)
+        if description is not _MISSING:
+            description = process(
+                description,
                 key="description",
-                rule=listing_rules.get("description"),
-                context={"response": response},
+                rule=get_rule("description"),
+                context=context,
             )
             if description:
-                item["description"] = description
+                item.description = description
                 self.logger.debug(
                     "Listing description pre-populated with %d characters",
                     len(description),
                 )
 
-        if "price" in listing_fields:
-            price = self.utilities.process_listing(
-                listing_fields.get("price"),
-                key="price",
-                rule=listing_rules.get("price"),
-                context={"response": response},
-            )
+        price = listing_fields.pop("price", _MISSING)
+        if price is not _MISSING:
+            price = process(price, key="price", rule=get_rule("price"), context=context)
             if price is not None:
-                item["price"] = price
-                self.logger.debug(
-                    "Listing price pre-populated as %s", item.get("price")
-                )
+                item.price = price
+                self.logger.debug("Listing price pre-populated as %s", price)
 
-        if "currency" in listing_fields:
-            currency = self.utilities.process_listing(
-                listing_fields.get("currency"),
-                key="currency",
-                rule=listing_rules.get("currency"),
-                context={"response": response},
+        currency = listing_fields.pop("currency", _MISSING)
+        if currency is not _MISSING:
+            currency = process(
+                currency, key="currency", rule=get_rule("currency"), context=context
             )
             if currency:
-                item["currency"] = currency
-                self.logger.debug(
-                    "Listing currency pre-populated as %s", item.get("currency")
-                )
+                item.currency = currency
+                self.logger.debug("Listing currency pre-populated as %s", currency)
 
         for key, value in listing_fields.items():
             if key in reserved:
                 continue
 
-            cleaned = self.utilities.process_listing(
-                value,
-                key=key,
-                rule=listing_rules.get(key),
-                context={"response": response},
-            )
+            cleaned = process(value, key=key, rule=get_rule(key), context=context)
             if cleaned is not None:
-                item[key] = cleaned
-                self.logger.debug(
-                    "Listing field %s pre-populated as %s", key, item[key]
-                )
+                setattr(item, key, cleaned)
+                self.logger.debug("Listing field %s pre-populated as %s", key, cleaned)
 
     # ------------------------------------------------------------------
     # Selector utilities
     # ------------------------------------------------------------------
     def _sel_nodes(self, root, rule: Optional[Dict]):
+        xpath = self._rule_xpath(rule)
+        if xpath is None:
+            return _EMPTY_SELECTION
+        result = self._eval_nodes(xpath, self._root_element(root))
+        return SelectorList(Selector(root=node, type="html") for node in result)
+
+    # _get_one/_get_all serialise the lxml matches directly, skipping the
+    # Selector wrapper parsel would allocate for every node.
+    def _get_one(self, root, rule: Optional[Dict]) -> Optional[str]:
+        nodes = self._eval_nodes(self._rule_xpath(rule), self._root_element(root))
+        if not nodes:
+            return None
+        return self._serialize_node(nodes[0]) or None
+
+    def _get_all(self, root, rule: Optional[Dict]) -> List[str]:
+        nodes = self._eval_nodes(self._rule_xpath(rule), self._root_element(root))
+        return [self._serialize_node(node) for node in nodes]
+
+    # Text variants for rich-text rules: element matches yield their text
+    # content straight from lxml instead of being serialised to HTML and
+    # stripped again with remove_tags.
+    def _get_text_one(self, root, rule: Optional[Dict]) -> Optional[str]:
+        # None exactly when _get_one would be; a matched element always
+        # serialises to markup, so its text is returned even when empty.
+        nodes = self._eval_nodes(self._rule_xpath(rule), self._root_element(root))
+        if not nodes:
+            return None
+        node = nodes[0]
+        if isinstance(node, etree._Element):
+            return self._node_text(node)
+        text = self._serialize_node(node)
+        if not text:
+            return None
+        return remove_tags(text) if "<" in text else text
+
+    def _get_text_all(self, root, rule: Optional[Dict]) -> List[str]:
+        nodes = self._eval_nodes(self._rule_xpath(rule), self._root_element(root))
+        return [self._node_text(node) for node in nodes]
+
+    @classmethod
+    def _node_text(cls, node: Any) -> str:
+        if isinstance(node, etree._Element):
+            text = etree.tostring(
+                node, method="text", encoding="unicode", with_tail=False
+            )
+            if not _HTML_ESCAPED_CHARS.intersection(text):
+                return text
+            # The HTML serialiser escapes these (except inside script/style),
+            # and remove_tags leaves the entities in place; take the slow
+            # path so the output stays identical.
+        text = cls._serialize_node(node)
+        return remove_tags(text) if "<" in text else text
+
+    @staticmethod
+    def _root_element(root) -> Any:
+        if isinstance(root, Response):
+            return root.selector.root
+        return root.root
+
+    def _compile_rules(self, section: Any) -> None:
+        """Compile every css/xpath rule in a config section up front."""
+        if isinstance(section, dict):
+            if "css" in section or "xpath" in section:
+                self._rule_xpaths[id(section)] = self._compile_rule_xpath(section)
+            for value in section.values():
+                self._compile_rules(value)
+        elif isinstance(section, list):
+            for value in section:
+                self._compile_rules(value)
+
+    @staticmethod
+    def _eval_nodes(xpath: Optional[etree.XPath], element: Any) -> List[Any]:
+        if xpath is None:
+            return []
+        result = xpath(element)
+        if not isinstance(result, list):
+            return [result]
+        return result
+
+    def _rule_xpath(self, rule: Optional[Dict]) -> Optional[etree.XPath]:
+        # Config rules are compiled in __init__, so this is normally one dict
+        # lookup; the css/xpath choice and "." prefix are already baked into
+        # the XPath. Rules built elsewhere are compiled on every call, since
+        # their ids are not pinned by self.cfg.
         if not rule:
-            return root.css(".__never__")
-        if "css" in rule and rule["css"]:
-            return root.css(rule["css"])
-        if "xpath" in rule and rule["xpath"]:
-            expression = rule["xpath"]
-            if expression.startswith("//") and isinstance(root, Selector):
-                expression = "." + expression
-            return root.xpath(expression)
-        return root.css(".__never__")
-
-    def _get_one(self, root, rule: Optional[Dict]):
-        sel = self._sel_nodes(root, rule)
-        return sel.get() or None
-
-    def _get_all(self, root, rule: Optional[Dict]):
-        sel = self._sel_nodes(root, rule)
-        return sel.getall()
+            return None
+        xpath = self._rule_xpaths.get(id(rule), _UNCOMPILED)
+        if xpath is _UNCOMPILED:
+            return self._compile_rule_xpath(rule)
+        return xpath
+
+    def _compile_rule_xpath(self, rule: Dict) -> Optional[etree.XPath]:
+        try:
+            if rule.get("css"):
+                expression = _CSS_TRANSLATOR.css_to_xpath(rule["css"])
+            elif rule.get("xpath"):
+                expression = rule["xpath"]
+                if expression.startswith("//"):
+                    expression = "." + expression
+            else:
+                return None
+            # Plain str results: nothing here walks back from a string to its
+            # parent, so lxml's smart-string wrappers would be pure overhead.
+            return etree.XPath(
+                expression, namespaces=_XPATH_NAMESPACES, smart_strings=False
+            )
+        except (SelectorError, etree.XPathError) as exc:
+            self.logger.warning("Ignoring invalid selector rule %s: %s", rule, exc)
+            return None
+
+    @staticmethod
+    def _serialize_node(node: Any) -> str:
+        # Mirrors parsel's Selector.get() for elements, strings and scalars.
+        if isinstance(node, etree._Element):
+            return etree.tostring(
+                node, method="html", encoding="unicode", with_tail=False
+            )
+        if node is True:
+            return "1"
+        if node is False:
+            return "0"
+        return str(node)
 
     def get_reserved_detail_keys(self) -> Set[str]:
-        return {"images", "description", "price", "currency"}
+        # A fresh set, so overrides can extend super()'s result in place.
+        return set(self._RESERVED_DETAIL_KEYS)
 
     def extract_card_listing_fields(self, response: Response, card) -> Dict[str, Any]:
-        fields_cfg = self.listing.get("fields", {}) or {}
         listing_data: Dict[str, Any] = {}
+        card_root = card.root
+        context = {"response": response}
 
-        for key, rule in fields_cfg.items():
-            value: Any = None
-
-            if isinstance(rule, dict) and "default_value" in rule:
-                value = rule["default_value"]
-            elif key == "images":
-                extracted = self._get_all(card, rule)
-                value = self.utilities.process_listing(
-                    extracted or [],
-                    key=key,
-                    rule=rule,
-                    position="prefix",
-                    context={"response": response},
-                )
-            elif key == "description":
-                if isinstance(rule, dict) and rule.get("get_all") is True:
-                    raw_value = self._get_all(card, rule) or []
-                else:
-                    raw_value = self._get_one(card, rule)
-                value = self.utilities.process_listing(
-                    raw_value,
-                    key=key,
-                    rule=rule,
-                    context={"response": response},
-                )
-            elif key == "price":
-                candidate = self._get_one(card, rule)
-                value = self.utilities.process_listing(
-                    candidate,
-                    key=key,
-                    rule=rule,
-                    context={"response": response},
-                )
-            elif key == "currency":
-                candidate = self._get_one(card, rule)
-                value = self.utilities.process_listing(
-                    candidate,
-                    key=key,
-                    rule=rule,
-                    context={"response": response},
-                )
-            elif isinstance(rule, dict) and rule.get("get_all") is True:
-                values = self._get_all(card, rule) or []
-                value = self.utilities.process_listing(
-                    values,
-                    key=key,
-                    rule=rule,
-                    position="prefix",
-                    context={"response": response},
-                )
+        for field in self._listing_field_plan:
+            key, rule, mode = field.key, field.rule, field.mode
+            if mode == "default":
+                value: Any = rule["default_value"]
             else:
-                raw_value = self._get_one(card, rule)
+                nodes = self._eval_nodes(field.xpath, card_root)
+                if mode == "all":
+                    raw_value: Any = [self._serialize_node(node) for node in nodes]
+                elif nodes:
+                    raw_value = self._serialize_node(nodes[0]) or None
+                else:
+                    raw_value = None
                 value = self.utilities.process_listing(
                     raw_value,
                     key=key,
                     rule=rule,
-                    context={"response": response},
+                    position=field.position,
+                    context=context,
                 )
 
             if value is None:
@@ -610,17 +927,53 @@ class ConfigurableBaseSpider(scrapy.Spider):
 
         return listing_data
 
+    def _build_listing_field_plan(self) -> List[_ListingFieldPlan]:
+        """Resolve, once, how each listing field is read from a card."""
+        plan = []
+        fields_cfg = self.listing.get("fields", {}) or {}
+        for key, rule in fields_cfg.items():
+            is_dict = isinstance(rule, dict)
+            get_all = is_dict and rule.get("get_all") is True
+            if is_dict and "default_value" in rule:
+                mode, position = "default", "suffix"
+            elif key == "images":
+                mode, position = "all", "prefix"
+            elif key == "description":
+                mode, position = ("all" if get_all else "one"), "suffix"
+            elif key in ("price", "currency"):
+                mode, position = "one", "suffix"
+            elif get_all:
+                mode, position = "all", "prefix"
+            else:
+                mode, position = "one", "suffix"
+            xpath = self._rule_xpath(rule) if is_dict else None
+            plan.append(_ListingFieldPlan(key, rule, xpath, mode, position))
+        return plan
+
+    @classmethod
+    def _load_config(cls, cfg_path: str) -> Dict[str, Any]:
+        mtime_ns = os.stat(cfg_path).st_mtime_ns
+        cached = cls._CONFIG_CACHE.get(cfg_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        raw = Path(cfg_path).read_bytes()
+        sites = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        cls._CONFIG_CACHE[cfg_path] = (mtime_ns, sites)
+        return sites
+
     @staticmethod
     def _resolve_config_path(config: str) -> str:
-        p = Path(config)
-        here = Path(__file__).resolve().parent
-        candidates = [
-            p,
-            here / p,
-            here.parent / p,
-        ]
+        if os.path.isabs(config):
+            # Joining an absolute path just yields it again; stat it once.
+            candidates: Tuple[str, ...] = (config,)
+        else:
+            candidates = (
+                config,
+                os.path.join(_SPIDERS_DIR, config),
+                os.path.join(os.path.dirname(_SPIDERS_DIR), config),
+            )
         for candidate in candidates:
-            if candidate.is_file():
-                return str(candidate)
-        tried = " | ".join(str(candidate) for candidate in candidates)
+            if os.path.isfile(candidate):
+                return candidate
+        tried = " | ".join(candidates)
         raise FileNotFoundError(f"Config not found. Tried: {tried}")
@@ -5,6 +5,8 @@ from scrapy.http import Response
 from ..items import BaseScrapperItem
 from .base_configurable_spider import ConfigurableBaseSpider
 
+_DIGITS_RE = re.compile(r"(\d+)")
+
 
 class ConfigurableCarSpider(ConfigurableBaseSpider):
     name = "configurable_car_spider"
@@ -20,7 +22,7 @@ class ConfigurableCarSpider(ConfigurableBaseSpider):
         doors_src = self._get_one(response, doors_rule)
         if not doors_src:
             return
-        match = re.search(r"(\d+)", doors_src)
+        match = _DIGITS_RE.search(doors_src)
         if match:
-            item["doors"] = int(match.group(1))
-            self.logger.debug("Doors extracted as %s", item["doors"])
+            item.doors = int(match.group(1))
+            self.logger.debug("Doors extracted as %s", item.doors)
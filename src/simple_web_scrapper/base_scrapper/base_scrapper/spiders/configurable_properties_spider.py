@@ -2,93 +2,102 @@ import re
 from typing import Dict
 
 from scrapy.http import Response
-from w3lib.html import remove_tags
 
 from ..items import PropertiesScrapperItem
 from .base_configurable_spider import ConfigurableBaseSpider
 
+_AMENITY_SEPARATOR_RE = re.compile(r"\s*[•|\n\r;/]\s*")
+_REPEATED_COMMAS_RE = re.compile(r"(,\s*){2,}")
+_AMENITY_SEPARATORS = str.maketrans("•|\n\r;/", ",,,,,,")
+_COORDINATES_RE = re.compile(r"([+-]?\d+(?:\.\d+)?),\s*([+-]?\d+(?:\.\d+)?)")
+# NBSP -> space; C0 controls (except tab/LF/CR), DEL and U+FFFD are dropped.
+_SANITIZE_TABLE = {
+    **dict.fromkeys(
+        (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F, 0xFFFD), None
+    ),
+    0xA0: " ",
+}
+
 
 class ConfigurablePropertiesSpider(ConfigurableBaseSpider):
     name = "configurable_properties_spider"
     item_cls = PropertiesScrapperItem
+    _RESERVED_DETAIL_KEYS = ConfigurableBaseSpider._RESERVED_DETAIL_KEYS | {
+        "coordinates",
+        "amenities",
+    }
 
     def get_pagination_cb_kwargs(self, next_page_num: int):
         return {"page_num": next_page_num}
 
-    def get_reserved_detail_keys(self):
-        reserved = super().get_reserved_detail_keys()
-        reserved.update({"coordinates", "amenities"})
-        return reserved
-
     # ------------------------------------------------------------------
     # Detail parsing customisation
     # ------------------------------------------------------------------
-    def populate_description(self, response: Response, item, fields: Dict) -> None:
-        rule = fields.get("description")
-        if rule:
-            self.populate_rich_text_field(response, item, rule, "description")
-
-        amenities_rule = fields.get("amenities")
-        if amenities_rule:
-            self.populate_rich_text_field(response, item, amenities_rule, "amenities")
+    def get_detail_handlers(self):
+        handlers = super().get_detail_handlers()
+        handlers.update(
+            {
+                "description": self.populate_rich_text_field,
+                "amenities": self.populate_rich_text_field,
+                "coordinates": self.populate_coordinates,
+            }
+        )
+        return handlers
 
     def populate_rich_text_field(
-        self, response: Response, item, rule: Dict, item_key: str
+        self, response: Response, item, key: str, rule: Dict
     ) -> None:
-        if isinstance(rule, dict) and "default_value" in rule:
-            item[item_key] = rule["default_value"]
-            self.logger.debug("%s assigned default value", item_key)
+        if not rule:
+            return
+
+        if "default_value" in rule:
+            setattr(item, key, rule["default_value"])
+            self.logger.debug("%s assigned default value", key)
             return
 
         if rule.get("get_all") is True:
-            parts = self._get_all(response, rule) or []
-            if isinstance(parts, str):
-                parts = [parts]
-            cleaned_parts = []
-            for part in parts:
-                if not part:
-                    continue
-                cleaned = self.sanitize_text(remove_tags(part))
-                if cleaned:
-                    cleaned_parts.append(cleaned)
-            if item_key == "amenities":
-                item[item_key] = ", ".join(cleaned_parts)
+            sanitize = self.sanitize_text
+            cleaned_parts = [
+                cleaned
+                for part in self._get_text_all(response, rule)
+                if (cleaned := sanitize(part))
+            ]
+            if key == "amenities":
+                setattr(item, key, ", ".join(cleaned_parts))
             else:
-                item[item_key] = " ".join(cleaned_parts)
+                setattr(item, key, " ".join(cleaned_parts))
         else:
-            html = self._get_one(response, rule)
-            if not html:
+            raw_text = self._get_text_one(response, rule)
+            if raw_text is None:
                 return
-            text = self.sanitize_text(remove_tags(html))
-            if item_key == "amenities":
-                text = re.sub(r"\s*[•|\n\r;/]\s*", ", ", text)
-                text = re.sub(r"(,\s*){2,}", ", ", text).strip(", ")
-            item[item_key] = text
+            text = self.sanitize_text(raw_text)
+            if key == "amenities":
+                if "," in text:
+                    text = _AMENITY_SEPARATOR_RE.sub(", ", text)
+                    text = _REPEATED_COMMAS_RE.sub(", ", text).strip(", ")
+                else:
+                    # Without literal commas every comma after the translate is
+                    # a separator, and the regexes reduce to split/strip/join.
+                    parts = text.translate(_AMENITY_SEPARATORS).split(",")
+                    text = ", ".join(filter(None, (part.strip() for part in parts)))
+            setattr(item, key, text)
 
-    def populate_additional_detail(
-        self, response: Response, item, fields: Dict
+    def populate_coordinates(
+        self, response: Response, item, key: str, rule: Dict
     ) -> None:
-        self.populate_coordinates(response, item, fields)
-
-    def populate_coordinates(self, response: Response, item, fields: Dict) -> None:
-        coord_rule = fields.get("coordinates")
-        if not coord_rule:
+        if not rule:
             return
-        src = self._get_one(response, coord_rule)
+        src = self._get_one(response, rule)
         if not src:
             return
-        match = re.search(r"([+-]?\d+(?:\.\d+)?),\s*([+-]?\d+(?:\.\d+)?)", str(src))
+        match = _COORDINATES_RE.search(str(src))
         if match:
-            item["coordinates"] = {
+            item.coordinates = {
                 "lat": float(match.group(1)),
                 "lng": float(match.group(2)),
             }
-            self.logger.debug("Coordinates extracted as %s", item["coordinates"])
+            self.logger.debug("Coordinates extracted as %s", item.coordinates)
 
     @staticmethod
     def sanitize_text(text: str) -> str:
-        text = text.replace("\u00a0", " ")
-        text = text.replace("\ufffd", "")
-        text = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]", "", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return " ".join(text.translate(_SANITIZE_TABLE).split())
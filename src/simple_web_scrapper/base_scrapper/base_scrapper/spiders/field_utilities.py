@@ -6,7 +6,9 @@ import re
 from collections.abc import Iterable as IterableABC
 from typing import (
     Any,
+    Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -16,16 +18,128 @@ from typing import (
     Union,
 )
 from urllib.parse import urljoin as urljoin_href
+from urllib.parse import urlsplit
 
-from scrapy.http import Response
+from scrapy.http import Response, TextResponse
+from scrapy.utils.response import get_base_url
 from w3lib.html import remove_tags
 
 T = TypeVar("T", bound=Union[str, Any])
 
+# Dropped from price digit runs by ``_price_digits``: ``[\s,\-/]``
+# (Unicode has no whitespace past U+3000).
+_PRICE_DROP = str.maketrans(
+    "", "", ",-/" + "".join(c for c in map(chr, range(0x3001)) if c.isspace())
+)
+# Substring -> label, checked in order by ``property_type_normalizer``.
+_PROPERTY_TYPES = (
+    ("studio", "Studio"),
+    ("apartment", "Apartment"),
+    ("villa", "Villa"),
+    ("townhouse", "Townhouse"),
+)
+_CURRENCY_CODE_RE = re.compile(r"[A-Za-z]+")
+_PRICE_RE = re.compile(r"(\d[\d\s,\-/]*)(?:[.,]\d{1,2})?")
+# URLs with these prefixes need no joining against the page base.
+_ABSOLUTE_PREFIXES = ("http://", "https://")
+
+
+def _is_plain_root_path(url: str) -> bool:
+    """True when ``urljoin(base, url)`` is just the base origin + ``url``.
+
+    That holds for a single-slash path with no dot segments, no ``;params``,
+    no empty query/fragment for urlunparse to drop and nothing urlsplit strips.
+    """
+    return (
+        url[:1] == "/"
+        and url[1:2] != "/"
+        and "/." not in url
+        and ";" not in url
+        and "?#" not in url
+        and not url.endswith(("?", "#"))
+        and url.isprintable()
+    )
+
 
 class FieldUtilities:
     """Collection of reusable utilities for field post-processing."""
 
+    BUILTIN_UTILITIES: Tuple[str, ...] = (
+        "clean_value",
+        "clean_sequence",
+        "normalize_images",
+        "normalize_description",
+        "normalize_price",
+        "normalize_currency",
+        "property_type_normalizer",
+        "absolute_value",
+        "clean_normalize_images",
+    )
+    # Adjacent utilities that have a single-pass equivalent.
+    FUSED_UTILITIES: Dict[Tuple[str, str], str] = {
+        ("clean_sequence", "normalize_images"): "clean_normalize_images",
+    }
+    # Utilities every field with one of these keys must run.
+    _REQUIRED_BY_KEY: Dict[Optional[str], Tuple[str, ...]] = {
+        "images": ("clean_sequence", "normalize_images"),
+        "description": ("normalize_description",),
+        "price": ("normalize_price",),
+        "currency": ("normalize_currency",),
+    }
+    # Utilities that read the pipeline context (``response``/``base``). Every
+    # other built-in is called with the value alone unless a subclass
+    # overrides it.
+    CONTEXT_UTILITIES: FrozenSet[str] = frozenset(
+        {"normalize_images", "clean_normalize_images"}
+    )
+    # Built-ins that return ``None`` for a ``None`` input. A pipeline made only
+    # of these (and none overridden) is skipped outright for missing values.
+    NONE_PRESERVING_UTILITIES: FrozenSet[str] = frozenset(
+        {
+            "clean_value",
+            "normalize_description",
+            "normalize_price",
+            "normalize_currency",
+            "property_type_normalizer",
+            "absolute_value",
+        }
+    )
+
+    def __init__(self) -> None:
+        # Rules are static config dicts, so a field's pipeline is resolved
+        # once. Keyed by id(rule); the rule itself is kept in the entry and
+        # compared by identity so a recycled id can never hit a stale entry.
+        # Entries pin their rules, so use one instance per spider.
+        self._pipeline_cache: Dict[
+            Tuple[str, str, int, str], Tuple[Any, Tuple[str, ...]]
+        ] = {}
+        # Bound utility methods by name, so run_pipeline does a dict lookup
+        # instead of getattr per value. Other names are added on first use.
+        self._handlers: Dict[str, Callable[..., Any]] = {
+            name: getattr(self, name) for name in self.BUILTIN_UTILITIES
+        }
+        # The name-based shortcuts below (fusion, calling without the context,
+        # skipping None) describe the base implementations only. A subclass
+        # override of a built-in runs as written: unfused, with the context
+        # and on None input.
+        overridden = frozenset(
+            name
+            for name in FieldUtilities.BUILTIN_UTILITIES
+            if getattr(type(self), name) is not getattr(FieldUtilities, name)
+        )
+        self._fusions: Dict[Tuple[str, str], str] = {
+            pair: fused
+            for pair, fused in self.FUSED_UTILITIES.items()
+            if overridden.isdisjoint(pair)
+        }
+        inherited = frozenset(FieldUtilities.BUILTIN_UTILITIES) - overridden
+        # Built-ins that ignore the context skip the ``**context`` unpacking.
+        self._context_free: FrozenSet[str] = inherited - self.CONTEXT_UTILITIES
+        self._none_preserving_utilities: FrozenSet[str] = (
+            inherited & self.NONE_PRESERVING_UTILITIES
+        )
+        self._none_preserving: Dict[Tuple[str, ...], bool] = {}
+
     # ------------------------------------------------------------------
     # High-level pipeline handlers
     # ------------------------------------------------------------------
@@ -38,7 +152,9 @@ class FieldUtilities:
         position: str = "suffix",
         context: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        pipeline = self.resolve_detail_pipeline(key, rule, position=position)
+        pipeline = self._cached_pipeline(
+            "detail", self.resolve_detail_pipeline, key, rule, position
+        )
         return self.apply_pipeline(value, pipeline, context=context)
 
     def process_listing(
@@ -50,7 +166,9 @@ class FieldUtilities:
         position: str = "suffix",
         context: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        pipeline = self.resolve_listing_pipeline(key, rule, position=position)
+        pipeline = self._cached_pipeline(
+            "listing", self.resolve_listing_pipeline, key, rule, position
+        )
         return self.apply_pipeline(value, pipeline, context=context)
 
     # ------------------------------------------------------------------
@@ -65,8 +183,19 @@ class FieldUtilities:
     ) -> Any:
         if not pipeline:
             return value
+        if value is None and self._preserves_none(pipeline):
+            return None
         return self.run_pipeline(value, pipeline, context=context)
 
+    def _preserves_none(self, pipeline: Sequence[str]) -> bool:
+        pipeline = tuple(pipeline)
+        preserves = self._none_preserving.get(pipeline)
+        if preserves is None:
+            preserves = self._none_preserving[pipeline] = all(
+                name in self._none_preserving_utilities for name in pipeline
+            )
+        return preserves
+
     def run_pipeline(
         self,
         value: Any,
@@ -79,17 +208,55 @@ class FieldUtilities:
             return value
 
         context = context or {}
+        handlers = self._handlers
+        context_free = self._context_free
         result = value
         for name in utilities:
-            handler = getattr(self, name, None)
+            handler = handlers.get(name)
             if handler is None:
-                raise KeyError(f"Unknown utility '{name}'")
-            result = handler(result, **context)
+                handler = getattr(self, name, None)
+                if handler is None:
+                    raise KeyError(f"Unknown utility '{name}'")
+                handlers[name] = handler
+            if name in context_free:
+                result = handler(result)
+            else:
+                result = handler(result, **context)
         return result
 
     # ------------------------------------------------------------------
     # Pipeline resolution helpers
     # ------------------------------------------------------------------
+    def _cached_pipeline(
+        self,
+        kind: str,
+        resolve: Callable[..., Sequence[str]],
+        key: str,
+        rule: Optional[Dict[str, Any]],
+        position: str,
+    ) -> Tuple[str, ...]:
+        cache_key = (kind, key, id(rule), position)
+        cached = self._pipeline_cache.get(cache_key)
+        if cached is not None and cached[0] is rule:
+            return cached[1]
+        pipeline = self._fuse_pipeline(tuple(resolve(key, rule, position=position)))
+        self._pipeline_cache[cache_key] = (rule, pipeline)
+        return pipeline
+
+    def _fuse_pipeline(self, pipeline: Tuple[str, ...]) -> Tuple[str, ...]:
+        fused: List[str] = []
+        index = 0
+        while index < len(pipeline):
+            pair = pipeline[index : index + 2]
+            replacement = self._fusions.get(pair) if len(pair) == 2 else None
+            if replacement is not None:
+                fused.append(replacement)
+                index += 2
+            else:
+                fused.append(pipeline[index])
+                index += 1
+        return tuple(fused)
+
     def resolve_detail_pipeline(
         self,
         key: str,
@@ -143,14 +310,9 @@ class FieldUtilities:
     def required_utilities_for_field(
         self, key: Optional[str], rule: Optional[Dict[str, Any]]
     ) -> Tuple[str, ...]:
-        if key == "images":
-            return ("clean_sequence", "normalize_images")
-        if key == "description":
-            return ("normalize_description",)
-        if key == "price":
-            return ("normalize_price",)
-        if key == "currency":
-            return ("normalize_currency",)
+        required = self._REQUIRED_BY_KEY.get(key)
+        if required is not None:
+            return required
         if isinstance(rule, dict) and rule.get("get_all") is True:
             return ("clean_sequence",)
         return ("clean_value",)
@@ -162,20 +324,29 @@ class FieldUtilities:
         if value is None:
             return None
         if isinstance(value, str):
-            text = remove_tags(value)
-            text = re.sub(r"\s+", " ", text)
-            text = text.strip()
+            # Most scraped values are plain text; only markup needs stripping.
+            text = remove_tags(value) if "<" in value else value
+            text = " ".join(text.split())
             return text or None
         return value
 
-    def clean_sequence(self, values: Optional[Any], **context: Any) -> List[str]:
+    def clean_sequence(self, values: Optional[Any], **_: Any) -> List[str]:
         """Normalize ANY input (string, number, iterable) into a cleaned list of strings."""
 
+        clean = self.clean_value
+        # getall() output: a plain list, cleaned without any type dispatch
+        if type(values) is list:
+            return [c for v in values if (c := clean(v)) is not None]
+
         if values is None:
             return []
 
+        # Other lists/tuples → iterate as-is (skips the ABC check)
+        if isinstance(values, (list, tuple)):
+            iterable: Iterable[Any] = values
+
         # If it's already a primitive → wrap as list
-        if isinstance(values, (int, float, bool)):
+        elif isinstance(values, (int, float, bool)):
             iterable = [str(values)]
 
         # If it's a single string → wrap as list
@@ -192,26 +363,15 @@ class FieldUtilities:
         else:
             iterable = [str(values)]
 
-        cleaned_list: List[str] = []
-        for value in iterable:
-            cleaned = self.clean_value(value, **context)
-            if cleaned is not None:
-                cleaned_list.append(cleaned)
-        return cleaned_list
+        return [c for v in iterable if (c := clean(v)) is not None]
 
     def property_type_normalizer(self, value: Optional[Any], **_: Any) -> Optional[str]:
         if not value:
             return None
 
-        types = {
-            "studio": "Studio",
-            "apartment": "Apartment",
-            "villa": "Villa",
-            "townhouse": "Townhouse",
-        }
-
-        for key, label in types.items():
-            if key in value.lower():
+        lowered = value.lower()
+        for key, label in _PROPERTY_TYPES:
+            if key in lowered:
                 return label
 
         return "Other"
@@ -227,10 +387,12 @@ class FieldUtilities:
         base: Optional[Union[Response, str]] = None,
         **_: Any,
     ) -> List[str]:
-        if values is None:
+        if not values:
             return []
 
-        if isinstance(values, str):
+        if isinstance(values, (list, tuple)):
+            raw_list = values
+        elif isinstance(values, str):
             raw_list = [values]
         elif isinstance(values, IterableABC) and not isinstance(
             values, (bytes, bytearray)
@@ -239,53 +401,127 @@ class FieldUtilities:
         else:
             raw_list = [values]
 
-        base_ref: Union[Response, str, None] = base or response
-        if isinstance(base_ref, Response):
-            join_url = base_ref.urljoin
-        else:
-            base_url = str(base_ref or "")
+        base_url = self._image_base_url(response, base)
+        origin = self._url_origin(base_url)
+        images: List[str] = []
+        append = images.append
+        for raw in raw_list:
+            if not isinstance(raw, str):
+                continue
+            url = raw.strip()
+            if not url or url.startswith("data:image/"):
+                continue
+            if url.startswith(_ABSOLUTE_PREFIXES):
+                append(url)
+            elif origin and _is_plain_root_path(url):
+                append(origin + url)
+            else:
+                append(urljoin_href(base_url, url))
+        # Galleries often repeat a URL (thumbnail + full size); keep first seen.
+        return list(dict.fromkeys(images))
+
+    def clean_normalize_images(
+        self,
+        values: Any,
+        *,
+        response: Optional[Response] = None,
+        base: Optional[Union[Response, str]] = None,
+        **_: Any,
+    ) -> List[str]:
+        """``clean_sequence`` followed by ``normalize_images`` in one pass."""
+        if values is None:
+            return []
 
-            def join_url(url: str) -> str:
-                return urljoin_href(base_url, url)
+        if isinstance(values, (list, tuple)):
+            raw_list: Iterable[Any] = values
+        elif isinstance(values, (int, float, bool)):
+            raw_list = (str(values),)
+        elif isinstance(values, str):
+            raw_list = (values,)
+        elif isinstance(values, IterableABC) and not isinstance(
+            values, (bytes, bytearray)
+        ):
+            raw_list = values
+        else:
+            raw_list = (str(values),)
 
+        base_url = self._image_base_url(response, base)
+        origin = self._url_origin(base_url)
         images: List[str] = []
+        append = images.append
         for raw in raw_list:
+            # clean_sequence keeps non-strings, but normalize_images drops them.
             if not isinstance(raw, str):
                 continue
-            url = raw.strip()
+            if "<" in raw:
+                raw = remove_tags(raw)
+            url = " ".join(raw.split())
             if not url or url.startswith("data:image/"):
                 continue
-            images.append(join_url(url))
-        return images
+            if url.startswith(_ABSOLUTE_PREFIXES):
+                append(url)
+            elif origin and _is_plain_root_path(url):
+                append(origin + url)
+            else:
+                append(urljoin_href(base_url, url))
+        return list(dict.fromkeys(images))
+
+    @staticmethod
+    def _image_base_url(
+        response: Optional[Response], base: Optional[Union[Response, str]]
+    ) -> str:
+        # Resolve the base once (honouring <base href> like Response.urljoin)
+        # rather than re-deriving it from the response for every image.
+        base_ref: Union[Response, str, None] = base or response
+        if isinstance(base_ref, TextResponse):
+            return get_base_url(base_ref)
+        if isinstance(base_ref, Response):
+            return base_ref.url
+        return str(base_ref or "")
+
+    @staticmethod
+    def _url_origin(base_url: str) -> str:
+        # Root-relative paths ("/img/1.jpg") only need the scheme and host, so
+        # the base is split once per page instead of inside every urljoin.
+        try:
+            parts = urlsplit(base_url)
+        except ValueError:
+            return ""
+        if parts.scheme in ("http", "https") and parts.netloc:
+            return f"{parts.scheme}://{parts.netloc}"
+        return ""
 
     def normalize_description(self, value: Any, **_: Any) -> Optional[str]:
         if value is None:
             return None
 
         if isinstance(value, (list, tuple, set)):
-            parts = [str(v) for v in value if v]
-            text = "\n".join(parts)
+            parts = [v for v in value if v]
+            try:
+                text = "\n".join(parts)
+            except TypeError:
+                # Only non-string parts need converting.
+                text = "\n".join(map(str, parts))
         else:
             text = str(value)
 
-        text = remove_tags(text)
-        text = text.replace("\u00a0", " ")
-        cleaned = re.sub(r"\s+", " ", text).strip()
+        if not text or text.isspace():
+            return None
+        if "<" in text:
+            text = remove_tags(text)
+        # str.split() already treats NBSP (and all Unicode spaces) as breaks.
+        cleaned = " ".join(text.split())
         return cleaned or None
 
     def normalize_price(self, value: Any, **_: Any) -> Optional[int]:
         if value is None:
             return None
 
-        candidates: Iterable[Any] = (
-            value if isinstance(value, (list, tuple, set)) else (value,)
-        )
+        if not isinstance(value, (list, tuple, set)):
+            return self._price_candidate(value)
 
-        for candidate in candidates:
-            if candidate is None:
-                continue
-            price_text = str(candidate).strip().replace("\u00a0", " ")
-            normalized = self._price_digits(price_text)
+        for candidate in value:
+            normalized = self._price_candidate(candidate)
             if normalized is not None:
                 return normalized
         return None
@@ -294,22 +530,13 @@ class FieldUtilities:
         if value is None:
             return None
 
-        candidates: Iterable[Any] = (
-            value if isinstance(value, (list, tuple, set)) else (value,)
-        )
+        if not isinstance(value, (list, tuple, set)):
+            return self._currency_candidate(value)
 
-        for candidate in candidates:
-            if not isinstance(candidate, str):
-                continue
-            currency_text = candidate.strip()
-            if not currency_text:
-                continue
-            if re.search(r"\d+", currency_text) or (2 <= len(currency_text) <= 3):
-                match = re.search(r"([A-Za-z]+)", currency_text)
-                if match:
-                    return match.group(1)
-            else:
-                return currency_text
+        for candidate in value:
+            currency = self._currency_candidate(candidate)
+            if currency is not None:
+                return currency
         return None
 
     def absolute_value(self, value: Any, **_: Any) -> Optional[Any]:
@@ -324,11 +551,15 @@ class FieldUtilities:
         # If it's a string that *might* be a number
         if isinstance(value, str):
             value = value.strip()
+            # ``isdecimal`` matches exactly ``\d``, so these mirror the
+            # ``-?\d+`` and ``-?\d+\.\d+`` patterns without a regex.
+            digits = value[1:] if value.startswith("-") else value
             # Try to parse as integer
-            if re.fullmatch(r"-?\d+", value):
+            if digits.isdecimal():
                 return abs(int(value))
             # Try to parse as float
-            if re.fullmatch(r"-?\d+(\.\d+)?", value):
+            whole, dot, fraction = digits.partition(".")
+            if dot and whole.isdecimal() and fraction.isdecimal():
                 return abs(float(value))
 
         # Default: return unchanged
@@ -337,11 +568,40 @@ class FieldUtilities:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _price_candidate(self, candidate: Any) -> Optional[int]:
+        if candidate is None:
+            return None
+        price_text = str(candidate).strip().replace("\u00a0", " ")
+        return self._price_digits(price_text)
+
+    def _currency_candidate(self, candidate: Any) -> Optional[str]:
+        if not isinstance(candidate, str):
+            return None
+        currency_text = candidate.strip()
+        if not currency_text:
+            return None
+        short = 2 <= len(currency_text) <= 3
+        # Bare ISO-style codes ("AED", "usd") are already the match.
+        if short and currency_text.isascii() and currency_text.isalpha():
+            return currency_text
+        if short or any(char.isdecimal() for char in currency_text):
+            match = _CURRENCY_CODE_RE.search(currency_text)
+            return match.group(0) if match else None
+        return currency_text
+
     def _price_digits(self, price_text: str) -> Optional[int]:
-        match = re.search(r"(\d[\d\s,\-/]*)(?:[.,]\d{1,2})?", price_text)
+        # ``isdecimal`` is exactly ``\d``; digits plus separators alone are the
+        # same run the regex would match.
+        if price_text.isdecimal():
+            return int(price_text)
+        stripped = price_text.translate(_PRICE_DROP)
+        if stripped.isdecimal():
+            return int(stripped)
+
+        match = _PRICE_RE.search(price_text)
         if not match:
             return None
-        normalized = re.sub(r"[\s,\-/]", "", match.group(1))
+        normalized = match.group(1).translate(_PRICE_DROP)
         if normalized.isdigit():
             return int(normalized)
         return None
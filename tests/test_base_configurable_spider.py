@@ -0,0 +1,379 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import scrapy
+from scrapy.http import HtmlResponse, Request
+from scrapy_selenium import SeleniumRequest
+from w3lib.html import remove_tags
+
+from simple_web_scrapper.base_scrapper.base_scrapper.spiders import (
+    base_configurable_spider,
+)
+from simple_web_scrapper.base_scrapper.base_scrapper.spiders.base_configurable_spider import (
+    ConfigurableBaseSpider,
+)
+
+SITE = {
+    "allowed_domains": ["example.com"],
+    "start_urls": ["https://example.com/list"],
+    "listing": {
+        "wait_css": "div.card",
+        "cards": {"css": "div.card"},
+        "title": {"css": "h3::text"},
+        "detail_link": {"xpath": "//a/@href"},
+        "fields": {"price": {"css": "span.price::text"}},
+    },
+    "detail": {
+        "wait_css": "div.price",
+        "fields": {
+            "price": {"css": "div.price::text"},
+            "color": {"css": "span.color::text", "utilities": ["clean_value"]},
+            "location": {"default_value": "Dubai"},
+        },
+    },
+}
+
+
+class Spider(ConfigurableBaseSpider):
+    name = "test_spider"
+
+
+class ConfigTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(ConfigurableBaseSpider._CONFIG_CACHE.clear)
+
+    def write_config(self, site=SITE, name="sites.json"):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w") as fh:
+            json.dump({"site": site}, fh)
+        return path
+
+    def make_spider(self, site=SITE, cls=Spider):
+        return cls(site="site", config=self.write_config(site))
+
+
+def detail_response(body, url="https://example.com/d/1"):
+    return HtmlResponse(url, body=body.encode(), encoding="utf-8")
+
+
+def parse_item(spider, body):
+    return next(spider.parse_detail(detail_response(body), title="t"))
+
+
+LISTING = """<html><body>
+<div class="card"><h3>First</h3><a href="/d/1">go</a>
+<span class="price">AED 1,200</span></div>
+<div class="card"><h3>Second</h3><a href="https://example.com/d/2">go</a></div>
+</body></html>"""
+
+
+def listing_response(body=LISTING, url="https://example.com/list"):
+    return HtmlResponse(url, body=body.encode(), encoding="utf-8", request=Request(url))
+
+
+class ConfigCacheTest(ConfigTestCase):
+    def test_spiders_do_not_mutate_the_cached_config(self):
+        path = self.write_config()
+        first = Spider(site="site", config=path)
+        second = Spider(site="site", config=path)
+
+        cached = ConfigurableBaseSpider._CONFIG_CACHE[path][1]
+        self.assertEqual(cached, {"site": SITE})
+        self.assertIs(first.cfg, second.cfg)
+        self.assertEqual(first.cfg, SITE)
+        self.assertIsNotNone(second._rule_xpath(second.listing["cards"]))
+
+    def test_config_is_reloaded_when_its_mtime_changes(self):
+        path = self.write_config()
+        first = Spider(site="site", config=path)
+        self.assertIs(Spider(site="site", config=path).cfg, first.cfg)
+
+        mtime_ns = os.stat(path).st_mtime_ns
+        path = self.write_config({**SITE, "start_urls": "https://example.com/new"})
+        os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        reloaded = Spider(site="site", config=path)
+
+        self.assertEqual(reloaded.start_urls, ["https://example.com/new"])
+        self.assertEqual(first.start_urls, ["https://example.com/list"])
+
+    def test_stdlib_json_is_used_without_orjson(self):
+        path = self.write_config()
+
+        with mock.patch.object(base_configurable_spider, "orjson", None):
+            spider = Spider(site="site", config=path)
+
+        self.assertEqual(spider.cfg, SITE)
+
+
+class DetailOpsTest(ConfigTestCase):
+    def test_legacy_populate_generic_fields_override_still_runs(self):
+        calls = []
+
+        class LegacySpider(Spider):
+            def populate_generic_fields(self, response, item, fields):
+                calls.append(sorted(fields))
+                super().populate_generic_fields(response, item, fields)
+
+        with self.assertLogs(level="WARNING") as logs:
+            spider = self.make_spider(cls=LegacySpider)
+        item = parse_item(
+            spider, '<div class="price">100</div><span class="color"> Red </span>'
+        )
+
+        self.assertIn("populate_generic_fields is deprecated", logs.output[0])
+        self.assertEqual(calls, [["color", "location", "price"]])
+        self.assertEqual((item.color, item.location, item.price), ("Red", "Dubai", 100))
+
+    def test_reserved_keys_can_be_extended_in_place(self):
+        class ReservingSpider(Spider):
+            def get_reserved_detail_keys(self):
+                keys = super().get_reserved_detail_keys()
+                keys.update({"color"})
+                return keys
+
+        spider = self.make_spider(cls=ReservingSpider)
+        item = parse_item(spider, '<span class="color">Red</span>')
+
+        self.assertIsNone(item.color)
+        self.assertEqual(item.location, "Dubai")
+        self.assertNotIn("color", Spider._RESERVED_DETAIL_KEYS)
+
+    def test_null_description_default_falls_back_to_extraction(self):
+        site = {**SITE, "detail": {"fields": {}}}
+        site["detail"]["fields"]["description"] = {
+            "css": "p.d::text",
+            "default_value": None,
+        }
+        spider = self.make_spider(site)
+
+        self.assertEqual(
+            parse_item(spider, '<p class="d">Nice</p>').description, "Nice"
+        )
+
+    def test_detail_ops_follow_config_order(self):
+        site = {**SITE, "detail": {"fields": {**SITE["detail"]["fields"]}}}
+        site["detail"]["fields"].update({"images": {}, "description": None})
+        with self.assertNoLogs(level="WARNING"):
+            spider = self.make_spider(site)
+
+        self.assertEqual(
+            [(op.func.__name__, op.keywords.get("key")) for op in spider._detail_ops],
+            [
+                ("populate_price", "price"),
+                ("populate_generic_field", "color"),
+                ("populate_generic_field", "location"),
+                ("populate_additional_detail", None),
+            ],
+        )
+
+    def test_legacy_handler_runs_once_per_page(self):
+        calls = []
+
+        class LegacySpider(Spider):
+            def get_detail_handlers(self):
+                handlers = super().get_detail_handlers()
+                handlers.update(color=self.populate_extras, doors=self.populate_extras)
+                return handlers
+
+            def populate_extras(self, response, item, fields):
+                calls.append(sorted(fields))
+                item.color = "Blue"
+
+        site = {**SITE, "detail": {"fields": {**SITE["detail"]["fields"]}}}
+        site["detail"]["fields"]["doors"] = {"css": "span.doors::text"}
+        with self.assertLogs(level="WARNING") as logs:
+            spider = self.make_spider(site, cls=LegacySpider)
+        item = parse_item(spider, '<span class="color">Red</span>')
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("populate_extras uses the deprecated", logs.output[0])
+        self.assertEqual(calls, [["color", "doors", "location", "price"]])
+        self.assertEqual(item.color, "Blue")
+
+
+class SelectorCompilationTest(ConfigTestCase):
+    def test_css_rules_are_compiled_to_xpath(self):
+        spider = self.make_spider()
+        response = detail_response('<div class="price">1 <b>2</b></div>')
+
+        self.assertEqual(spider._get_one(response, {"css": "div.price::text"}), "1 ")
+        self.assertEqual(
+            spider._get_all(response, {"css": "div.price *"}), ["<b>2</b>"]
+        )
+        self.assertEqual(
+            spider._get_one(response, {"css": "div::attr(class)"}), "price"
+        )
+
+    def test_absolute_xpath_is_relative_to_each_card(self):
+        spider = self.make_spider()
+        requests = list(spider.parse(listing_response()))
+
+        self.assertEqual(
+            [request.url for request in requests],
+            ["https://example.com/d/1", "https://example.com/d/2"],
+        )
+        self.assertEqual(
+            [request.cb_kwargs["title"] for request in requests], ["First", "Second"]
+        )
+        self.assertEqual(requests[0].cb_kwargs["listing_fields"]["price"], 1200)
+        self.assertNotIn("listing_fields", requests[1].cb_kwargs)
+
+    def test_invalid_selector_is_logged_and_matches_nothing(self):
+        site = {**SITE, "detail": {"fields": {"color": {"css": "span[["}}}}
+        with self.assertLogs(level="WARNING") as logs:
+            spider = self.make_spider(site)
+
+        self.assertIn("Ignoring invalid selector", logs.output[0])
+        self.assertEqual(len(logs.output), 1)
+        self.assertIsNone(parse_item(spider, "<span>Red</span>").color)
+
+
+DETAIL = """<html><body>
+<div class="desc"><p>Great &amp; <b>big</b></p> tail<!-- note --><br><p></p></div>
+<a href="/x?a=1&amp;b=2" title="T">link</a>
+<div class="js">1 &lt; 2<script>if (a<b && c>d) go()</script></div>
+</body></html>"""
+
+RULES = [
+    {"css": "div.desc p"},
+    {"css": "div.desc"},
+    {"css": "div.js"},
+    {"css": "div.desc p::text"},
+    {"css": "a::attr(href)"},
+    {"xpath": "//a/@title"},
+    {"xpath": "count(//p)"},
+    {"xpath": "boolean(//a)"},
+    {"css": "span.missing"},
+]
+
+
+class SerializationTest(ConfigTestCase):
+    def test_get_one_and_get_all_match_parsel(self):
+        spider = self.make_spider()
+        response = detail_response(DETAIL)
+
+        for rule in RULES:
+            with self.subTest(rule=rule):
+                selection = (
+                    response.css(rule["css"])
+                    if "css" in rule
+                    else response.xpath(rule["xpath"])
+                )
+                self.assertEqual(spider._get_one(response, rule), selection.get())
+                self.assertEqual(spider._get_all(response, rule), selection.getall())
+                self.assertIs(type(spider._get_one(response, rule) or ""), str)
+
+    def test_text_variants_match_remove_tags(self):
+        spider = self.make_spider()
+        response = detail_response(DETAIL)
+
+        for rule in RULES:
+            with self.subTest(rule=rule):
+                html = spider._get_one(response, rule)
+                self.assertEqual(
+                    spider._get_text_one(response, rule),
+                    remove_tags(html) if html else None,
+                )
+                self.assertEqual(
+                    spider._get_text_all(response, rule),
+                    [remove_tags(part) for part in spider._get_all(response, rule)],
+                )
+
+
+class RenderModeTest(ConfigTestCase):
+    def test_unknown_render_mode_is_rejected(self):
+        site = {**SITE, "detail": {**SITE["detail"], "render": "chrome"}}
+
+        with self.assertRaisesRegex(ValueError, "detail.render must be one of"):
+            self.make_spider(site)
+
+    def test_http_sections_use_plain_requests(self):
+        site = {
+            **SITE,
+            "listing": {**SITE["listing"], "render": "http"},
+            "detail": {**SITE["detail"], "render": "http"},
+        }
+        spider = self.make_spider(site)
+
+        requests = [*spider.start_requests(), *spider.parse(listing_response())]
+
+        self.assertEqual(len(requests), 3)
+        for request in requests:
+            self.assertIs(type(request), scrapy.Request)
+
+    def test_selenium_sections_use_selenium_requests(self):
+        spider = self.make_spider()
+
+        requests = [*spider.start_requests(), *spider.parse(listing_response())]
+
+        self.assertEqual(len(requests), 3)
+        for request in requests:
+            self.assertIsInstance(request, SeleniumRequest)
+        self.assertTrue(requests[1].meta["selenium_pool"])
+
+
+class FakeDriver:
+    def __init__(self, url, html):
+        self.current_url = url
+        self.html = html
+        self.calls = []
+
+    def set_script_timeout(self, seconds):
+        self.calls.append(("timeout", seconds))
+
+    def execute_script(self, script, *args):
+        self.calls.append(("script", args))
+        return self.html
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(("async", args))
+        return self.html
+
+
+class ListingScrollTest(ConfigTestCase):
+    def make_scroll_spider(self, scroll):
+        return self.make_spider(
+            {**SITE, "listing": {**SITE["listing"], "scroll": scroll}}
+        )
+
+    def parse_with_driver(self, spider):
+        response = listing_response()
+        driver = FakeDriver(response.url, LISTING)
+        response.request.meta["driver"] = driver
+        requests = list(spider.parse(response))
+        return driver, requests
+
+    def test_scroll_block_drives_async_script_with_timeout(self):
+        spider = self.make_scroll_spider({"passes": 8, "idle_ms": 500})
+        driver, requests = self.parse_with_driver(spider)
+
+        self.assertEqual(driver.calls, [("timeout", 14.0), ("async", (8, 1000, 500))])
+        self.assertEqual(len(requests), 2)
+
+    def test_without_scroll_block_scrolls_once(self):
+        driver, requests = self.parse_with_driver(self.make_spider())
+
+        self.assertEqual(driver.calls, [("script", ())])
+        self.assertEqual(len(requests), 2)
+
+    def test_malformed_scroll_block_is_rejected(self):
+        for scroll, message in (
+            (["passes"], "must be an object"),
+            ({"pases": 3}, "Unknown listing.scroll keys: pases"),
+            ({"passes": "3"}, "passes must be an integer >= 1"),
+            ({"passes": True}, "passes must be an integer >= 1"),
+            ({"delta": 0}, "delta must be an integer >= 1"),
+            ({"idle_ms": -1}, "idle_ms must be an integer >= 0"),
+        ):
+            with self.subTest(scroll=scroll):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.make_scroll_spider(scroll)
+
+
+if __name__ == "__main__":
+    unittest.main()
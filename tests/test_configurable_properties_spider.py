@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+
+from scrapy.http import HtmlResponse
+
+from simple_web_scrapper.base_scrapper.base_scrapper.spiders.configurable_properties_spider import (
+    ConfigurablePropertiesSpider,
+)
+
+
+def make_site(detail_fields):
+    return {
+        "allowed_domains": ["example.com"],
+        "start_urls": "https://example.com/list",
+        "listing": {"cards": {"css": "div.card"}},
+        "detail": {"fields": detail_fields},
+    }
+
+
+class RichTextFieldTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(ConfigurablePropertiesSpider._CONFIG_CACHE.clear)
+
+    def parse_item(self, detail_fields, body):
+        path = os.path.join(self.tmpdir.name, "sites.json")
+        with open(path, "w") as fh:
+            json.dump({"site": make_site(detail_fields)}, fh)
+        spider = ConfigurablePropertiesSpider(site="site", config=path)
+        response = HtmlResponse(
+            "https://example.com/d/1", body=body.encode(), encoding="utf-8"
+        )
+        return next(spider.parse_detail(response, title="t"))
+
+    def test_markup_is_reduced_to_sanitized_text(self):
+        item = self.parse_item(
+            {
+                "description": {"css": "div.desc"},
+                "amenities": {"css": "ul.am li", "get_all": True},
+            },
+            '<div class="desc"><p>Great  <b>home</b></p>\n<p>view\x07</p></div>'
+            '<ul class="am"><li>Pool</li><li> Gym </li><li>  </li></ul>',
+        )
+
+        self.assertEqual(item.description, "Great home view")
+        self.assertEqual(item.amenities, "Pool, Gym")
+
+    def test_blank_match_assigns_empty_string(self):
+        item = self.parse_item(
+            {
+                "description": {"css": "div.desc"},
+                "amenities": {"css": "ul.am li", "get_all": True},
+            },
+            '<div class="desc"> <br> </div><ul class="am"><li> </li></ul>',
+        )
+
+        self.assertEqual(item.description, "")
+        self.assertEqual(item.amenities, "")
+
+    def test_missing_match_leaves_field_unset(self):
+        item = self.parse_item(
+            {"description": {"css": "div.missing"}, "amenities": {"css": "a::attr(x)"}},
+            '<a x="">link</a>',
+        )
+
+        self.assertIsNone(item.description)
+        self.assertIsNone(item.amenities)
+
+
+if __name__ == "__main__":
+    unittest.main()
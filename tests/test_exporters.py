@@ -0,0 +1,52 @@
+import io
+import json
+import unittest
+
+from simple_web_scrapper.base_scrapper.base_scrapper.exporters import (
+    JsonItemExporter,
+    JsonLinesItemExporter,
+)
+from simple_web_scrapper.base_scrapper.base_scrapper.items import (
+    PropertiesScrapperItem,
+)
+
+
+def export(exporter_cls, item, **kwargs):
+    output = io.BytesIO()
+    exporter = exporter_cls(output, **kwargs)
+    exporter.start_exporting()
+    exporter.export_item(item)
+    exporter.finish_exporting()
+    return output.getvalue()
+
+
+class SkipUnsetFieldsExporterTest(unittest.TestCase):
+    def make_item(self):
+        item = PropertiesScrapperItem(url="https://example.com/1", price=0)
+        item.images = []
+        return item
+
+    def test_unset_fields_are_left_out(self):
+        item = self.make_item()
+
+        self.assertEqual(
+            json.loads(export(JsonLinesItemExporter, item)),
+            {"url": "https://example.com/1", "price": 0, "images": []},
+        )
+        self.assertEqual(
+            json.loads(export(JsonItemExporter, item)),
+            [{"url": "https://example.com/1", "price": 0, "images": []}],
+        )
+        self.assertIsNone(item.title)
+
+    def test_export_empty_fields_keeps_every_field(self):
+        exported = json.loads(
+            export(JsonLinesItemExporter, self.make_item(), export_empty_fields=True)
+        )
+
+        self.assertIn("title", exported)
+        self.assertIsNone(exported["title"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from simple_web_scrapper.base_scrapper.base_scrapper.spiders.field_utilities import (
+    FieldUtilities,
+)
+
+IMAGES_RULE = {"css": "img::attr(src)"}
+
+
+class FieldUtilitiesOverrideTest(unittest.TestCase):
+    def test_images_pipeline_is_fused_by_default(self):
+        utilities = FieldUtilities()
+        images = utilities.process_detail(
+            [" /a.jpg ", "/a.jpg"],
+            key="images",
+            rule=IMAGES_RULE,
+            context={"base": "https://example.com/"},
+        )
+
+        self.assertEqual(images, ["https://example.com/a.jpg"])
+        self.assertEqual(
+            utilities._fuse_pipeline(("clean_sequence", "normalize_images")),
+            ("clean_normalize_images",),
+        )
+
+    def test_overridden_utility_is_not_fused_away(self):
+        class Utilities(FieldUtilities):
+            def normalize_images(self, values, **context):
+                return ["custom"]
+
+        images = Utilities().process_detail(
+            ["/a.jpg"],
+            key="images",
+            rule=IMAGES_RULE,
+            context={"base": "https://example.com/"},
+        )
+
+        self.assertEqual(images, ["custom"])
+
+    def test_overridden_utility_receives_context(self):
+        class Utilities(FieldUtilities):
+            def clean_value(self, value, **context):
+                return context["response"]
+
+        self.assertEqual(
+            Utilities().process_detail("x", key="title", context={"response": "resp"}),
+            "resp",
+        )
+        self.assertEqual(
+            FieldUtilities().process_detail(
+                " x ", key="title", context={"response": "resp"}
+            ),
+            "x",
+        )
+
+    def test_overridden_utility_sees_none(self):
+        class Utilities(FieldUtilities):
+            def normalize_price(self, value, **_):
+                return 0 if value is None else super().normalize_price(value)
+
+        self.assertEqual(Utilities().process_detail(None, key="price"), 0)
+        self.assertIsNone(FieldUtilities().process_detail(None, key="price"))
+
+
+if __name__ == "__main__":
+    unittest.main()
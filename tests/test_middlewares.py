@@ -0,0 +1,158 @@
+import unittest
+from unittest import mock
+
+from scrapy import Request
+from scrapy_selenium import SeleniumRequest
+from twisted.internet import defer
+
+from simple_web_scrapper.base_scrapper.base_scrapper import middlewares
+from simple_web_scrapper.base_scrapper.base_scrapper.middlewares import (
+    SeleniumPoolMiddleware,
+)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.current_url = None
+        self.page_source = ""
+        self.quit_called = False
+
+    def get(self, url):
+        self.current_url = url
+        self.page_source = f"<html><body>{url}</body></html>"
+
+    def add_cookie(self, cookie):
+        pass
+
+    def get_screenshot_as_png(self):
+        return b"png"
+
+    def execute_script(self, script):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def new_fake_driver(self):
+    return FakeDriver()
+
+
+def run_inline(func, *args, **kwargs):
+    return defer.maybeDeferred(func, *args, **kwargs)
+
+
+def resolve(coroutine):
+    results = []
+    defer.ensureDeferred(coroutine).addBoth(results.append)
+    return results[0]
+
+
+@mock.patch.object(SeleniumPoolMiddleware, "_new_driver", new_fake_driver)
+@mock.patch.object(middlewares.threads, "deferToThread", run_inline)
+@mock.patch.object(middlewares, "maybe_deferred_to_future", lambda d: d)
+class SeleniumPoolMiddlewareTest(unittest.TestCase):
+    def make_middleware(self, pool_size=2):
+        return SeleniumPoolMiddleware(
+            driver_name="chrome",
+            driver_executable_path="chromedriver",
+            driver_arguments=[],
+            browser_executable_path=None,
+            pool_size=pool_size,
+        )
+
+    def test_pool_starts_lazily_on_first_pooled_request(self):
+        middleware = self.make_middleware()
+        self.assertIsNone(middleware._pool)
+
+        request = SeleniumRequest(
+            url="https://example.com/a", meta={"selenium_pool": True}
+        )
+        response = resolve(middleware.process_request(request, spider=None))
+
+        self.assertEqual(response.url, "https://example.com/a")
+        self.assertIn(b"https://example.com/a", response.body)
+        self.assertEqual(len(middleware._pool_drivers), 2)
+        self.assertNotIn("driver", request.meta)
+
+    def test_driver_is_returned_to_pool(self):
+        middleware = self.make_middleware()
+        for path in ("a", "b", "c"):
+            request = SeleniumRequest(
+                url=f"https://example.com/{path}",
+                meta={"selenium_pool": True},
+                screenshot=True,
+            )
+            resolve(middleware.process_request(request, spider=None))
+            self.assertEqual(request.meta["screenshot"], b"png")
+        self.assertEqual(middleware._pool.qsize(), 2)
+
+    def test_driver_is_returned_to_pool_on_error(self):
+        middleware = self.make_middleware(pool_size=1)
+        middleware.start_pool(1)
+        driver = middleware._pool_drivers[0]
+        request = SeleniumRequest(
+            url="https://example.com/a", meta={"selenium_pool": True}
+        )
+        with mock.patch.object(driver, "get", side_effect=RuntimeError):
+            failure = resolve(middleware.process_request(request, spider=None))
+        failure.trap(RuntimeError)
+        self.assertEqual(middleware._pool.qsize(), 1)
+
+    def test_failed_pool_start_quits_started_drivers_and_retries(self):
+        middleware = self.make_middleware(pool_size=3)
+        started = [FakeDriver(), FakeDriver()]
+        launches = iter([*started, RuntimeError("no chrome")])
+
+        def flaky_new_driver():
+            result = next(launches)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with mock.patch.object(middleware, "_new_driver", flaky_new_driver):
+            failure = resolve(middleware.start_pool(3))
+        failure.trap(RuntimeError)
+
+        self.assertTrue(all(d.quit_called for d in started))
+        self.assertIsNone(middleware._pool)
+        self.assertIsNone(middleware._pool_slots)
+
+        resolve(middleware.start_pool(3))
+        self.assertEqual(middleware._pool.qsize(), 3)
+        self.assertEqual(middleware._pool_slots.limit, 3)
+
+    def test_non_pooled_requests_fall_through(self):
+        middleware = self.make_middleware()
+
+        self.assertIsNone(
+            resolve(middleware.process_request(Request("https://e.com"), None))
+        )
+        request = SeleniumRequest(url="https://example.com/listing")
+        response = resolve(middleware.process_request(request, spider=None))
+
+        self.assertIs(request.meta["driver"], middleware.driver)
+        self.assertEqual(response.url, "https://example.com/listing")
+        self.assertIsNone(middleware._pool)
+
+    def test_pool_size_zero_uses_shared_driver(self):
+        middleware = self.make_middleware(pool_size=0)
+        request = SeleniumRequest(
+            url="https://example.com/a", meta={"selenium_pool": True}
+        )
+        resolve(middleware.process_request(request, spider=None))
+
+        self.assertIsNone(middleware._pool)
+        self.assertIs(request.meta["driver"], middleware.driver)
+
+    def test_spider_closed_quits_every_driver(self):
+        middleware = self.make_middleware()
+        middleware.start_pool(middleware.pool_size)
+        middleware.spider_closed()
+
+        self.assertTrue(middleware.driver.quit_called)
+        self.assertTrue(all(d.quit_called for d in middleware._pool_drivers))
+
+
+if __name__ == "__main__":
+    unittest.main()